@@ -9,6 +9,47 @@ from dataclasses import dataclass
 from typing import List, Tuple, Optional, Dict, Any
 
 
+# Problems at least this large (in either dimension) use the optional
+# lap.lapjv backend when it is installed
+LAP_THRESHOLD = 200
+
+# Cached lap module; False once the import has failed
+_lap_module = None
+
+
+def _get_lap():
+    """Return the optional lap module, or None if it is not installed"""
+    global _lap_module
+    if _lap_module is None:
+        try:
+            import lap
+            _lap_module = lap
+        except ImportError:
+            _lap_module = False
+    return _lap_module or None
+
+
+def _solve_assignment(cost_matrix: np.ndarray, maximize: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Solve a (possibly rectangular) assignment problem
+    
+    Uses lap.lapjv for large matrices when available and
+    scipy.optimize.linear_sum_assignment otherwise.
+    
+    Returns:
+        (row_ind, col_ind) arrays in the format of linear_sum_assignment
+    """
+    lap = _get_lap() if max(cost_matrix.shape) >= LAP_THRESHOLD else None
+    if lap is None:
+        return linear_sum_assignment(cost_matrix, maximize=maximize)
+    
+    matrix = -cost_matrix if maximize else cost_matrix
+    n_rows, n_cols = matrix.shape
+    _, row_to_col, _ = lap.lapjv(matrix, extend_cost=n_rows != n_cols)
+    row_ind = np.flatnonzero(row_to_col >= 0)
+    return row_ind, row_to_col[row_ind].astype(np.intp)
+
+
 @dataclass
 class AssignmentResult:
     """Contains assignment problem solution results"""
@@ -27,8 +68,9 @@ class AssignmentSolver:
     Solves the problem of assigning n workers to n tasks (or m workers to n tasks)
     to minimize total cost or maximize total efficiency/profit.
     
-    Uses scipy.optimize.linear_sum_assignment which implements the Hungarian Algorithm
-    with O(n³) complexity.
+    Uses scipy.optimize.linear_sum_assignment (a compiled Jonker-Volgenant
+    shortest augmenting path solver) with O(n³) complexity, or the optional
+    lap.lapjv extension for matrices of LAP_THRESHOLD rows/columns or more.
     """
     
     def __init__(
@@ -47,7 +89,8 @@ class AssignmentSolver:
             row_names: Optional names for rows (workers)
             col_names: Optional names for columns (tasks)
         """
-        self.cost_matrix = np.array(cost_matrix, dtype=float)
+        # No copy when the caller already passes a float64 array (the matrix is never mutated)
+        self.cost_matrix = np.asarray(cost_matrix, dtype=float)
         self.maximize = maximize
         self.n_rows, self.n_cols = self.cost_matrix.shape
         self.row_names = row_names or [f"Worker {i+1}" for i in range(self.n_rows)]
@@ -65,44 +108,23 @@ class AssignmentSolver:
             AssignmentResult containing the optimal assignment
         """
         try:
-            # For maximization, negate the cost matrix
-            if self.maximize:
-                solve_matrix = -self.cost_matrix
-            else:
-                solve_matrix = self.cost_matrix
-            
-            # Handle non-square matrices by making them square
-            if self.n_rows != self.n_cols:
-                # Pad with zeros (or high costs for minimization) to make square
-                max_dim = max(self.n_rows, self.n_cols)
-                padded_matrix = np.zeros((max_dim, max_dim))
-                
-                if not self.maximize:
-                    # For minimization, pad with high value to avoid dummy assignments
-                    padded_matrix.fill(np.max(solve_matrix) * 1000)
-                
-                padded_matrix[:self.n_rows, :self.n_cols] = solve_matrix
-                solve_matrix = padded_matrix
-            
-            # Solve using Hungarian algorithm
-            self._row_ind, self._col_ind = linear_sum_assignment(solve_matrix)
+            # Both backends handle rectangular matrices natively, so no
+            # padding is needed
+            self._row_ind, self._col_ind = _solve_assignment(
+                self.cost_matrix, self.maximize
+            )
             
-            # Filter out dummy assignments
-            valid_assignments = [
-                (r, c) for r, c in zip(self._row_ind, self._col_ind)
-                if r < self.n_rows and c < self.n_cols
-            ]
+            # Every returned pair is a real (row, col) assignment
+            valid_assignments = list(zip(self._row_ind.tolist(), self._col_ind.tolist()))
             
             # Calculate total cost/profit
-            individual_costs = [
-                self.cost_matrix[r, c] for r, c in valid_assignments
-            ]
-            total_cost = sum(individual_costs)
+            assigned_costs = self.cost_matrix[self._row_ind, self._col_ind]
+            individual_costs = assigned_costs.tolist()
+            total_cost = float(assigned_costs.sum())
             
             # Create binary assignment matrix
             assignment_matrix = np.zeros_like(self.cost_matrix, dtype=int)
-            for r, c in valid_assignments:
-                assignment_matrix[r, c] = 1
+            assignment_matrix[self._row_ind, self._col_ind] = 1
             
             self._result = AssignmentResult(
                 success=True,
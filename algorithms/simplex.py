@@ -4,9 +4,10 @@ Supports Linear Programming problems with 10+ decision variables and constraints
 """
 
 import numpy as np
+import scipy.sparse as sp
 from scipy.optimize import linprog
 from dataclasses import dataclass
-from typing import Optional, List, Tuple, Dict, Any
+from typing import Optional, List, Tuple, Dict, Any, Union
 
 
 @dataclass
@@ -48,7 +49,7 @@ class SimplexSolver:
     def __init__(
         self,
         c: np.ndarray,
-        A_ub: Optional[np.ndarray] = None,
+        A_ub: Optional[Union[np.ndarray, sp.spmatrix]] = None,
         b_ub: Optional[np.ndarray] = None,
         A_eq: Optional[np.ndarray] = None,
         b_eq: Optional[np.ndarray] = None,
@@ -62,7 +63,7 @@ class SimplexSolver:
         
         Args:
             c: Coefficients of the objective function
-            A_ub: Coefficient matrix for inequality constraints (≤)
+            A_ub: Coefficient matrix for inequality constraints (≤), dense or scipy.sparse
             b_ub: Right-hand side of inequality constraints
             A_eq: Coefficient matrix for equality constraints
             b_eq: Right-hand side of equality constraints
@@ -72,7 +73,13 @@ class SimplexSolver:
             constraint_names: Optional names for constraints
         """
         self.c = np.array(c, dtype=float)
-        self.A_ub = np.array(A_ub, dtype=float) if A_ub is not None else None
+        if A_ub is None:
+            self.A_ub = None
+        elif sp.issparse(A_ub):
+            # Sparse matrices go to HiGHS as they are
+            self.A_ub = sp.csr_matrix(A_ub, dtype=float)
+        else:
+            self.A_ub = np.array(A_ub, dtype=float)
         self.b_ub = np.array(b_ub, dtype=float) if b_ub is not None else None
         self.A_eq = np.array(A_eq, dtype=float) if A_eq is not None else None
         self.b_eq = np.array(b_eq, dtype=float) if b_eq is not None else None
@@ -82,7 +89,7 @@ class SimplexSolver:
         self.constraint_names = constraint_names or []
         
         self._result = None
-        self._sensitivity = None
+        self._sensitivity = None  # Formatted sensitivity report, built on first request
     
     def solve(self) -> SimplexResult:
         """
@@ -91,20 +98,37 @@ class SimplexSolver:
         Returns:
             SimplexResult containing the solution and sensitivity analysis
         """
+        self._sensitivity = None
+        
         # For maximization, negate the objective coefficients
         c_solve = -self.c if self.maximize else self.c
         
         try:
-            # Solve using HiGHS method (most robust)
-            result = linprog(
-                c_solve,
-                A_ub=self.A_ub,
-                b_ub=self.b_ub,
-                A_eq=self.A_eq,
-                b_eq=self.b_eq,
-                bounds=self.bounds,
-                method='highs'
-            )
+            support = self._support_masks()
+            if support is None:
+                # Solve using the HiGHS dual simplex, which always ends on a basic
+                # (vertex) solution as the sensitivity analysis expects
+                result = linprog(
+                    c_solve,
+                    A_ub=self.A_ub,
+                    b_ub=self.b_ub,
+                    A_eq=self.A_eq,
+                    b_eq=self.b_eq,
+                    bounds=self.bounds,
+                    method='highs-ds'
+                )
+            else:
+                # Solve on the rows and columns that can matter, then map back
+                cols, rows = support
+                result = linprog(
+                    c_solve[cols],
+                    A_ub=self.A_ub[rows][:, cols],
+                    b_ub=self.b_ub[rows],
+                    bounds=(0, None),
+                    method='highs-ds'
+                )
+                if result.success:
+                    self._expand_result(result, cols, rows)
             
             if result.success:
                 # Calculate optimal value (negate back if maximization)
@@ -146,6 +170,94 @@ class SimplexSolver:
         
         return self._result
     
+    def matches(
+        self,
+        c: np.ndarray,
+        A_ub: Optional[Union[np.ndarray, sp.spmatrix]],
+        b_ub: Optional[np.ndarray],
+        maximize: bool,
+        variable_names: Optional[List[str]] = None,
+        constraint_names: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Check whether this solver holds exactly the given inequality problem
+        
+        Used to reuse a previous solve when a problem is submitted again
+        unchanged; linprog cannot be warm-started from a previous basis.
+        """
+        def dense(matrix):
+            return matrix.toarray() if sp.issparse(matrix) else matrix
+        
+        if maximize != self.maximize or self.A_eq is not None:
+            return False
+        if (A_ub is None) != (self.A_ub is None) or (b_ub is None) != (self.b_ub is None):
+            return False
+        if variable_names is not None and list(variable_names) != self.variable_names:
+            return False
+        if constraint_names is not None and list(constraint_names) != self.constraint_names:
+            return False
+        return (
+            np.array_equal(np.asarray(c, dtype=float), self.c)
+            and (A_ub is None or np.array_equal(dense(A_ub), dense(self.A_ub)))
+            and (b_ub is None or np.array_equal(np.asarray(b_ub, dtype=float), self.b_ub))
+        )
+    
+    def _support_masks(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Find the columns and rows of the inequality problem that can affect the optimum
+        
+        A variable with a zero objective coefficient and an all-zero column
+        stays at its lower bound of 0, and a constraint with an all-zero row
+        and a zero RHS (0 <= 0) never binds, so both can be left out of the
+        solve. Only plain problems (no equality constraints, default bounds)
+        are pruned.
+        
+        Returns:
+            (column mask, row mask), or None when nothing can be pruned
+        """
+        if self.A_ub is None or self.b_ub is None or self.A_eq is not None:
+            return None
+        # bounds may be one (min, max) pair shared by every variable, as linprog allows
+        shared = len(self.bounds) == 2 and all(b is None or np.isscalar(b) for b in self.bounds)
+        pairs = [self.bounds] if shared else self.bounds
+        if any(tuple(b) != (0, None) for b in pairs):
+            return None
+        
+        if sp.issparse(self.A_ub):
+            col_used = self.A_ub.getnnz(axis=0) > 0
+            row_used = self.A_ub.getnnz(axis=1) > 0
+        else:
+            nonzero = self.A_ub != 0
+            col_used = nonzero.any(axis=0)
+            row_used = nonzero.any(axis=1)
+        
+        cols = col_used | (self.c != 0)
+        rows = row_used | (self.b_ub != 0)
+        if cols.all() and rows.all() or not cols.any() or not rows.any():
+            return None
+        return cols, rows
+    
+    def _expand_result(self, result, cols: np.ndarray, rows: np.ndarray):
+        """Scatter a pruned linprog result back to the full problem size, in place"""
+        def scatter(values, mask, fill=0.0):
+            full = np.full(len(mask), fill)
+            full[mask] = values
+            return full
+        
+        # Pruned variables sit at 0 with a zero reduced cost; pruned
+        # constraints are 0 <= 0 with zero slack and shadow price
+        result.x = scatter(result.x, cols)
+        for bound in ('lower', 'upper'):
+            side = getattr(result, bound, None)
+            if side is not None and getattr(side, 'marginals', None) is not None:
+                side.marginals = scatter(side.marginals, cols)
+        ineqlin = getattr(result, 'ineqlin', None)
+        if ineqlin is not None:
+            if getattr(ineqlin, 'marginals', None) is not None:
+                ineqlin.marginals = scatter(ineqlin.marginals, rows)
+            if getattr(ineqlin, 'residual', None) is not None:
+                ineqlin.residual = scatter(ineqlin.residual, rows)
+    
     def _compute_sensitivity_analysis(self, result) -> SensitivityAnalysis:
         """
         Compute sensitivity analysis from the LP solution
@@ -180,12 +292,10 @@ class SimplexSolver:
                 reduced_costs = marginals if not self.maximize else -marginals
         
         # Calculate slack values for inequality constraints
-        slack_values = np.zeros(n_ub)
-        if self.A_ub is not None and self.b_ub is not None:
-            slack_values = self.b_ub - np.dot(self.A_ub, result.x)
+        slack_values = self._get_slack_values(result) if n_ub else np.zeros(0)
         
         # Compute allowable ranges for RHS values
-        constraint_rhs_ranges = self._compute_rhs_ranges(result, shadow_prices)
+        constraint_rhs_ranges = self._compute_rhs_ranges(slack_values, shadow_prices)
         
         # Compute allowable ranges for objective coefficients
         objective_coeff_ranges = self._compute_objective_ranges(result, reduced_costs)
@@ -198,80 +308,81 @@ class SimplexSolver:
             objective_coeff_ranges=objective_coeff_ranges
         )
     
-    def _compute_rhs_ranges(self, result, shadow_prices: np.ndarray) -> List[Dict]:
+    def _compute_rhs_ranges(self, slack_values: np.ndarray, shadow_prices: np.ndarray) -> List[Dict]:
         """Compute allowable ranges for constraint RHS values"""
-        ranges = []
         n_ub = len(self.b_ub) if self.b_ub is not None else 0
+        if n_ub == 0:
+            return []
         
-        for i in range(n_ub):
-            current_rhs = self.b_ub[i]
-            
-            # Estimate allowable ranges based on slack and shadow prices
-            if shadow_prices[i] != 0:
-                # Binding constraint - calculate ranges
-                allowable_increase = float('inf')
-                allowable_decrease = float('inf')
-                
-                # Use slack values to estimate decrease
-                if i < len(self._get_slack_values(result)):
-                    allowable_decrease = min(allowable_decrease, abs(current_rhs * 0.5))
-                
-                ranges.append({
-                    'constraint': i + 1,
-                    'name': self.constraint_names[i] if i < len(self.constraint_names) else f"Constraint {i+1}",
-                    'current_rhs': current_rhs,
-                    'shadow_price': shadow_prices[i],
-                    'allowable_increase': allowable_increase,
-                    'allowable_decrease': allowable_decrease
-                })
-            else:
-                # Non-binding constraint
-                ranges.append({
-                    'constraint': i + 1,
-                    'name': self.constraint_names[i] if i < len(self.constraint_names) else f"Constraint {i+1}",
-                    'current_rhs': current_rhs,
-                    'shadow_price': 0.0,
-                    'allowable_increase': float('inf'),
-                    'allowable_decrease': self._get_slack_values(result)[i] if i < len(self._get_slack_values(result)) else 0
-                })
-        
-        return ranges
+        current_rhs = np.asarray(self.b_ub, dtype=float)
+        prices = shadow_prices[:n_ub]
+        binding = prices != 0
+        
+        # Slack values are only available when A_ub is set
+        slacks = np.zeros(n_ub)
+        has_slack = np.arange(n_ub) < len(slack_values)
+        slacks[:len(slack_values)] = slack_values[:n_ub]
+        
+        # Binding: estimate the decrease from the RHS; non-binding: the slack
+        allowable_decrease = np.where(
+            binding,
+            np.where(has_slack, np.abs(current_rhs * 0.5), np.inf),
+            slacks
+        )
+        prices = np.where(binding, prices, 0.0)
+        
+        return [
+            {
+                'constraint': i + 1,
+                'name': self.constraint_names[i] if i < len(self.constraint_names) else f"Constraint {i+1}",
+                'current_rhs': rhs,
+                'shadow_price': price,
+                'allowable_increase': float('inf'),
+                'allowable_decrease': dec
+            }
+            for i, (rhs, price, dec) in enumerate(zip(
+                current_rhs.tolist(), prices.tolist(), allowable_decrease.tolist()
+            ))
+        ]
     
     def _compute_objective_ranges(self, result, reduced_costs: np.ndarray) -> List[Dict]:
         """Compute allowable ranges for objective function coefficients"""
-        ranges = []
+        n_vars = len(self.c)
+        values = np.asarray(result.x[:n_vars], dtype=float)
+        basic = values > 1e-6
         
-        for i in range(len(self.c)):
-            current_coeff = self.c[i]
-            current_value = result.x[i]
-            
-            if current_value > 1e-6:  # Basic variable
-                ranges.append({
-                    'variable': i + 1,
-                    'name': self.variable_names[i],
-                    'current_coefficient': current_coeff,
-                    'current_value': current_value,
-                    'reduced_cost': 0.0,
-                    'allowable_increase': float('inf'),
-                    'allowable_decrease': float('inf')
-                })
-            else:  # Non-basic variable
-                ranges.append({
-                    'variable': i + 1,
-                    'name': self.variable_names[i],
-                    'current_coefficient': current_coeff,
-                    'current_value': current_value,
-                    'reduced_cost': reduced_costs[i] if i < len(reduced_costs) else 0,
-                    'allowable_increase': abs(reduced_costs[i]) if i < len(reduced_costs) else float('inf'),
-                    'allowable_decrease': float('inf')
-                })
-        
-        return ranges
+        # Non-basic variables may increase by |reduced cost| before entering the basis
+        costs = np.zeros(n_vars)
+        has_cost = np.arange(n_vars) < len(reduced_costs)
+        costs[:len(reduced_costs)] = reduced_costs[:n_vars]
+        
+        reduced = np.where(basic, 0.0, costs)
+        allowable_increase = np.where(basic | ~has_cost, np.inf, np.abs(costs))
+        
+        return [
+            {
+                'variable': i + 1,
+                'name': self.variable_names[i],
+                'current_coefficient': coeff,
+                'current_value': value,
+                'reduced_cost': rc,
+                'allowable_increase': inc,
+                'allowable_decrease': float('inf')
+            }
+            for i, (coeff, value, rc, inc) in enumerate(zip(
+                np.asarray(self.c, dtype=float).tolist(), values.tolist(),
+                reduced.tolist(), allowable_increase.tolist()
+            ))
+        ]
     
     def _get_slack_values(self, result) -> np.ndarray:
         """Get slack values from the solution"""
+        # HiGHS reports the inequality residuals b_ub - A_ub @ x directly
+        residual = getattr(getattr(result, 'ineqlin', None), 'residual', None)
+        if residual is not None and self.b_ub is not None and len(residual) == len(self.b_ub):
+            return np.asarray(residual, dtype=float)
         if self.A_ub is not None and self.b_ub is not None:
-            return self.b_ub - np.dot(self.A_ub, result.x)
+            return self.b_ub - self.A_ub @ result.x
         return np.array([])
     
     def get_solution_summary(self) -> Dict[str, Any]:
@@ -309,16 +420,20 @@ class SimplexSolver:
         if self._result is None or self._result.sensitivity is None:
             return {"error": "Sensitivity analysis not available"}
         
+        # The report only changes when solve() runs again
+        if self._sensitivity is not None:
+            return self._sensitivity
+        
         sens = self._result.sensitivity
         
-        return {
+        self._sensitivity = {
             "shadow_prices": [
                 {
                     "constraint": i + 1,
                     "name": self.constraint_names[i] if i < len(self.constraint_names) else f"Constraint {i+1}",
-                    "value": round(sp, 4)
+                    "value": round(price, 4)
                 }
-                for i, sp in enumerate(sens.shadow_prices)
+                for i, price in enumerate(sens.shadow_prices)
             ],
             "reduced_costs": [
                 {
@@ -338,6 +453,7 @@ class SimplexSolver:
             "rhs_ranges": sens.constraint_rhs_ranges,
             "objective_ranges": sens.objective_coeff_ranges
         }
+        return self._sensitivity
 
 
 def create_sample_problem() -> SimplexSolver:
@@ -424,6 +540,6 @@ if __name__ == "__main__":
     sens_report = solver.get_sensitivity_report()
     
     print("\nShadow Prices (Value of additional resources):")
-    for sp in sens_report['shadow_prices']:
-        if sp['value'] != 0:
-            print(f"  {sp['name']}: ${sp['value']:.2f} per unit")
+    for price in sens_report['shadow_prices']:
+        if price['value'] != 0:
+            print(f"  {price['name']}: ${price['value']:.2f} per unit")
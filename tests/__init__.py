@@ -0,0 +1,4 @@
+"""
+Tests Module
+Regression tests for the solvers
+"""
@@ -0,0 +1,41 @@
+"""
+Regression tests for the Simplex solver
+"""
+
+import numpy as np
+
+from algorithms.simplex import SimplexSolver
+
+
+def test_solve_with_single_bounds_pair():
+    """A single (min, max) pair applies to every variable, as in linprog"""
+    # x3 and the second constraint are all zero, so the solve is pruned
+    solver = SimplexSolver(
+        c=np.array([3.0, 5.0, 0.0]),
+        A_ub=np.array([[1.0, 2.0, 0.0], [0.0, 0.0, 0.0], [3.0, 1.0, 0.0]]),
+        b_ub=np.array([8.0, 0.0, 9.0]),
+        bounds=(0, None),
+        maximize=True
+    )
+    
+    result = solver.solve()
+    
+    assert result.success, result.message
+    assert np.isclose(result.optimal_value, 21.0)
+    assert np.allclose(result.solution, [2.0, 3.0, 0.0])
+
+
+def test_single_bounds_pair_matches_per_variable_bounds():
+    """The shared-pair form gives the same optimum as explicit per-variable bounds"""
+    problem = dict(
+        c=np.array([2.0, 1.0]),
+        A_ub=np.array([[1.0, 1.0], [1.0, 0.0]]),
+        b_ub=np.array([4.0, 3.0]),
+        maximize=True
+    )
+    
+    shared = SimplexSolver(bounds=(0, None), **problem).solve()
+    explicit = SimplexSolver(bounds=[(0, None), (0, None)], **problem).solve()
+    
+    assert shared.success and explicit.success
+    assert np.isclose(shared.optimal_value, explicit.optimal_value)
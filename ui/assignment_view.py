@@ -9,9 +9,34 @@ from typing import Optional, List
 
 from ui.components.matrix_input import MatrixInput
 from ui.components.result_display import ResultDisplay, AllocationMatrixDisplay
-from algorithms.assignment import AssignmentSolver, create_sample_problem
 from config.settings import WORKERS, TASKS, DEFAULT_MATRIX_SIZE
 
+# PP Chemicals sample problem, built once at import (read-only)
+_SAMPLE_EFFICIENCY_MATRIX = np.array([
+    [85, 70, 65, 80, 75, 90, 60, 50, 70, 65],
+    [75, 85, 70, 65, 80, 75, 70, 60, 65, 70],
+    [80, 75, 90, 70, 65, 80, 75, 55, 80, 60],
+    [65, 80, 75, 90, 70, 65, 80, 70, 75, 80],
+    [70, 65, 80, 75, 90, 70, 65, 75, 60, 85],
+    [90, 75, 70, 65, 80, 85, 70, 80, 65, 70],
+    [60, 90, 65, 80, 75, 70, 95, 65, 80, 75],
+    [55, 65, 80, 70, 85, 75, 70, 90, 70, 80],
+    [75, 70, 85, 75, 70, 80, 75, 70, 95, 65],
+    [70, 75, 60, 85, 80, 70, 80, 75, 70, 90]
+], dtype=np.int32)
+_SAMPLE_EFFICIENCY_MATRIX.flags.writeable = False
+
+_SAMPLE_WORKERS = (
+    "Ali Khan", "Bilal Ahmed", "Chaudhry Imran", "Danish Malik",
+    "Ejaz Shah", "Farhan Raza", "Ghulam Abbas", "Hassan Javed",
+    "Irfan Siddiqui", "Junaid Tariq"
+)
+
+_SAMPLE_TASKS = (
+    "Mixing", "Heating", "Testing", "Packing", "Loading",
+    "QC", "Maintenance", "Docs", "Safety", "Dispatch"
+)
+
 
 class AssignmentView(ctk.CTkFrame):
     """
@@ -29,6 +54,7 @@ class AssignmentView(ctk.CTkFrame):
         super().__init__(parent, **kwargs)
         
         self.matrix_size = DEFAULT_MATRIX_SIZE
+        self._rng = np.random.default_rng()
         
         self._create_layout()
         self._create_widgets()
@@ -210,30 +236,10 @@ class AssignmentView(ctk.CTkFrame):
     
     def _load_sample(self):
         """Load sample PP Chemicals worker assignment"""
-        # Sample efficiency matrix
-        efficiency_matrix = np.array([
-            [85, 70, 65, 80, 75, 90, 60, 50, 70, 65],
-            [75, 85, 70, 65, 80, 75, 70, 60, 65, 70],
-            [80, 75, 90, 70, 65, 80, 75, 55, 80, 60],
-            [65, 80, 75, 90, 70, 65, 80, 70, 75, 80],
-            [70, 65, 80, 75, 90, 70, 65, 75, 60, 85],
-            [90, 75, 70, 65, 80, 85, 70, 80, 65, 70],
-            [60, 90, 65, 80, 75, 70, 95, 65, 80, 75],
-            [55, 65, 80, 70, 85, 75, 70, 90, 70, 80],
-            [75, 70, 85, 75, 70, 80, 75, 70, 95, 65],
-            [70, 75, 60, 85, 80, 70, 80, 75, 70, 90]
-        ])
-        
-        self.matrix_input.set_matrix(efficiency_matrix)
-        self.matrix_input.set_row_headers([
-            "Ali Khan", "Bilal Ahmed", "Chaudhry Imran", "Danish Malik",
-            "Ejaz Shah", "Farhan Raza", "Ghulam Abbas", "Hassan Javed",
-            "Irfan Siddiqui", "Junaid Tariq"
-        ])
-        self.matrix_input.set_col_headers([
-            "Mixing", "Heating", "Testing", "Packing", "Loading",
-            "QC", "Maintenance", "Docs", "Safety", "Dispatch"
-        ])
+        self.matrix_input.set_matrix(_SAMPLE_EFFICIENCY_MATRIX)
+        # Headers are copied because MatrixInput extends its header lists on resize
+        self.matrix_input.set_row_headers(list(_SAMPLE_WORKERS))
+        self.matrix_input.set_col_headers(list(_SAMPLE_TASKS))
         
         self.objective_var.set("maximize")
     
@@ -246,6 +252,10 @@ class AssignmentView(ctk.CTkFrame):
             if new_rows < 1 or new_cols < 1:
                 return
             
+            # Nothing to do when the shape is unchanged
+            if (new_rows, new_cols) == (self.matrix_input.rows, self.matrix_input.cols):
+                return
+            
             self.matrix_size = max(new_rows, new_cols)
             self.matrix_input.resize(new_rows, new_cols)
             
@@ -254,13 +264,17 @@ class AssignmentView(ctk.CTkFrame):
     
     def _generate_random(self):
         """Generate random matrix data"""
-        matrix = np.random.randint(10, 100, (self.matrix_size, self.matrix_size))
+        matrix = self._rng.integers(10, 100, size=(self.matrix_size, self.matrix_size), dtype=np.int32)
         self.matrix_input.set_matrix(matrix)
     
     def _solve(self):
         """Solve the assignment problem"""
+        # Imported here so scipy is only loaded once a solve is requested
+        from algorithms.assignment import AssignmentSolver
+        
         try:
-            # Get input data
+            # Read the input widgets exactly once; these snapshots are the
+            # objects passed to the solver and to both result displays
             cost_matrix = self.matrix_input.get_matrix()
             maximize = self.objective_var.get() == "maximize"
             row_names = self.matrix_input.get_row_headers()
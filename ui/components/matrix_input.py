@@ -21,6 +21,14 @@ except ImportError:
     FONTS = {"family": "Segoe UI"}
 
 
+def _parse_float(text: str) -> float:
+    """Parse an entry's text, treating anything unparsable as 0"""
+    try:
+        return float(text)
+    except ValueError:
+        return 0.0
+
+
 class ScrollableFrame(ctk.CTkFrame):
     """
     A frame that supports both horizontal and vertical scrolling.
@@ -222,10 +230,18 @@ class MatrixInput(ctk.CTkFrame):
         self.row_headers = row_headers or [f"R{i+1}" for i in range(rows)]
         self.col_headers = col_headers or [f"C{j+1}" for j in range(cols)]
         
-        # Storage for entry widgets
+        # Storage for entry widgets; rows and columns hidden by a shrinking
+        # resize stay here (past self.rows / self.cols) for reuse
         self.cells: List[List[ctk.CTkEntry]] = []
         self.row_header_entries: List[ctk.CTkEntry] = []
         self.col_header_entries: List[ctk.CTkEntry] = []
+        self._row_header_widgets: List[ctk.CTkBaseClass] = []
+        self._col_header_widgets: List[ctk.CTkBaseClass] = []
+        
+        # Parsed cell values; cells whose text changed since the last
+        # get_matrix are listed in _dirty and re-parsed on the next call
+        self._parsed = np.zeros((0, 0))
+        self._dirty = set()
         
         self._create_widgets()
     
@@ -252,172 +268,115 @@ class MatrixInput(ctk.CTkFrame):
         corner.grid(row=0, column=0, padx=1, pady=1)
         
         # Create column headers
-        for j, header in enumerate(self.col_headers):
-            if self.editable_headers:
-                entry = ctk.CTkEntry(
-                    self.scroll_frame,
-                    width=self.cell_width,
-                    height=self.cell_height,
-                    justify="center"
-                )
-                entry.insert(0, header)
-                entry.grid(row=0, column=j+1, padx=1, pady=1)
-                self.col_header_entries.append(entry)
-            else:
-                label = ctk.CTkLabel(
-                    self.scroll_frame,
-                    text=header[:10],
-                    width=self.cell_width,
-                    height=self.cell_height,
-                    font=ctk.CTkFont(weight="bold"),
-                    fg_color=("gray80", "gray30"),
-                    corner_radius=5
-                )
-                label.grid(row=0, column=j+1, padx=1, pady=1)
+        for j in range(self.cols):
+            self._create_col_header(j)
         
         # Create rows with headers and cells
         for i in range(self.rows):
-            row_cells = []
-            
-            # Row header
-            if self.editable_headers:
-                entry = ctk.CTkEntry(
-                    self.scroll_frame,
-                    width=self.cell_width,
-                    height=self.cell_height,
-                    justify="center"
-                )
-                entry.insert(0, self.row_headers[i] if i < len(self.row_headers) else f"R{i+1}")
-                entry.grid(row=i+1, column=0, padx=1, pady=1)
-                self.row_header_entries.append(entry)
-            else:
-                label = ctk.CTkLabel(
-                    self.scroll_frame,
-                    text=self.row_headers[i][:12] if i < len(self.row_headers) else f"R{i+1}",
-                    width=self.cell_width,
-                    height=self.cell_height,
-                    font=ctk.CTkFont(weight="bold"),
-                    fg_color=("gray80", "gray30"),
-                    corner_radius=5
-                )
-                label.grid(row=i+1, column=0, padx=1, pady=1)
-            
-            # Data cells
-            for j in range(self.cols):
-                entry = ctk.CTkEntry(
-                    self.scroll_frame,
-                    width=self.cell_width,
-                    height=self.cell_height,
-                    justify="center"
-                )
-                entry.insert(0, self.default_value)
-                entry.grid(row=i+1, column=j+1, padx=1, pady=1)
-                
-                if self.on_change:
-                    entry.bind("<KeyRelease>", lambda e: self.on_change())
-                
-                row_cells.append(entry)
-            
-            self.cells.append(row_cells)
+            self._create_row_header(i)
+            self.cells.append([self._create_cell(i, j) for j in range(self.cols)])
     
-    def _recreate_grid_widgets(self):
-        """Recreate only the grid widgets (used by resize)"""
-        # Create corner cell (empty)
-        corner = ctk.CTkLabel(
+    def _create_header(self, text: str) -> ctk.CTkBaseClass:
+        """Create a header widget: an entry if headers are editable, else a label"""
+        if self.editable_headers:
+            entry = ctk.CTkEntry(
+                self.scroll_frame,
+                width=self.cell_width,
+                height=self.cell_height,
+                justify="center"
+            )
+            entry.insert(0, text)
+            return entry
+        return ctk.CTkLabel(
             self.scroll_frame,
-            text="",
+            text=text,
             width=self.cell_width,
-            height=self.cell_height
+            height=self.cell_height,
+            font=ctk.CTkFont(weight="bold"),
+            fg_color=("gray80", "gray30"),
+            corner_radius=5
         )
-        corner.grid(row=0, column=0, padx=1, pady=1)
+    
+    def _set_header_text(self, widget: ctk.CTkBaseClass, text: str):
+        """Replace the text of a header widget"""
+        if self.editable_headers:
+            widget.delete(0, "end")
+            widget.insert(0, text)
+        else:
+            widget.configure(text=text)
+    
+    def _col_header_text(self, j: int) -> str:
+        """Text shown in the header of column j"""
+        if self.editable_headers:
+            return self.col_headers[j] if j < len(self.col_headers) else f"C{j+1}"
+        return self.col_headers[j][:10] if j < len(self.col_headers) else f"C{j+1}"
+    
+    def _row_header_text(self, i: int) -> str:
+        """Text shown in the header of row i"""
+        if self.editable_headers:
+            return self.row_headers[i] if i < len(self.row_headers) else f"R{i+1}"
+        return self.row_headers[i][:12] if i < len(self.row_headers) else f"R{i+1}"
+    
+    def _create_col_header(self, j: int):
+        """Create and grid the header of column j"""
+        header = self._create_header(self._col_header_text(j))
+        header.grid(row=0, column=j+1, padx=1, pady=1)
+        self._col_header_widgets.append(header)
+        if self.editable_headers:
+            self.col_header_entries.append(header)
+    
+    def _create_row_header(self, i: int):
+        """Create and grid the header of row i"""
+        header = self._create_header(self._row_header_text(i))
+        header.grid(row=i+1, column=0, padx=1, pady=1)
+        self._row_header_widgets.append(header)
+        if self.editable_headers:
+            self.row_header_entries.append(header)
+    
+    def _create_cell(self, i: int, j: int) -> ctk.CTkEntry:
+        """Create and grid the data cell at row i, column j"""
+        # The variable trace catches every edit, typed or programmatic
+        text = tk.StringVar(self)
+        text.trace_add("write", lambda *_, key=(i, j): self._dirty.add(key))
+        entry = ctk.CTkEntry(
+            self.scroll_frame,
+            width=self.cell_width,
+            height=self.cell_height,
+            justify="center",
+            textvariable=text
+        )
+        entry.insert(0, self.default_value)
+        entry.grid(row=i+1, column=j+1, padx=1, pady=1)
         
-        # Create column headers
-        for j, header in enumerate(self.col_headers[:self.cols]):
-            if self.editable_headers:
-                entry = ctk.CTkEntry(
-                    self.scroll_frame,
-                    width=self.cell_width,
-                    height=self.cell_height,
-                    justify="center"
-                )
-                entry.insert(0, header)
-                entry.grid(row=0, column=j+1, padx=1, pady=1)
-                self.col_header_entries.append(entry)
-            else:
-                label = ctk.CTkLabel(
-                    self.scroll_frame,
-                    text=header[:10],
-                    width=self.cell_width,
-                    height=self.cell_height,
-                    font=ctk.CTkFont(weight="bold"),
-                    fg_color=("gray80", "gray30"),
-                    corner_radius=5
-                )
-                label.grid(row=0, column=j+1, padx=1, pady=1)
+        if self.on_change:
+            entry.bind("<KeyRelease>", lambda e: self.on_change())
         
-        # Create rows with headers and cells
-        for i in range(self.rows):
-            row_cells = []
-            
-            # Row header
-            if self.editable_headers:
-                entry = ctk.CTkEntry(
-                    self.scroll_frame,
-                    width=self.cell_width,
-                    height=self.cell_height,
-                    justify="center"
-                )
-                entry.insert(0, self.row_headers[i] if i < len(self.row_headers) else f"R{i+1}")
-                entry.grid(row=i+1, column=0, padx=1, pady=1)
-                self.row_header_entries.append(entry)
-            else:
-                label = ctk.CTkLabel(
-                    self.scroll_frame,
-                    text=self.row_headers[i][:12] if i < len(self.row_headers) else f"R{i+1}",
-                    width=self.cell_width,
-                    height=self.cell_height,
-                    font=ctk.CTkFont(weight="bold"),
-                    fg_color=("gray80", "gray30"),
-                    corner_radius=5
-                )
-                label.grid(row=i+1, column=0, padx=1, pady=1)
-            
-            # Data cells
-            for j in range(self.cols):
-                entry = ctk.CTkEntry(
-                    self.scroll_frame,
-                    width=self.cell_width,
-                    height=self.cell_height,
-                    justify="center"
-                )
-                entry.insert(0, self.default_value)
-                entry.grid(row=i+1, column=j+1, padx=1, pady=1)
-                
-                if self.on_change:
-                    entry.bind("<KeyRelease>", lambda e: self.on_change())
-                
-                row_cells.append(entry)
-            
-            self.cells.append(row_cells)
-
+        return entry
+    
     def get_matrix(self) -> np.ndarray:
         """
         Get the current matrix values as a numpy array
         
+        Only cells edited since the previous call are read back from
+        their entries; the rest come from the parsed cache.
+        
         Returns:
             2D numpy array of float values
         """
-        matrix = np.zeros((self.rows, self.cols))
-        
-        for i in range(self.rows):
-            for j in range(self.cols):
-                try:
-                    value = float(self.cells[i][j].get())
-                except ValueError:
-                    value = 0.0
-                matrix[i, j] = value
-        
-        return matrix
+        if self._parsed.shape != (self.rows, self.cols):
+            # Cells new to the shape were all written by resize, so they are dirty
+            parsed = np.zeros((self.rows, self.cols))
+            rows = min(self.rows, self._parsed.shape[0])
+            cols = min(self.cols, self._parsed.shape[1])
+            parsed[:rows, :cols] = self._parsed[:rows, :cols]
+            self._parsed = parsed
+        
+        for i, j in self._dirty:
+            if i < self.rows and j < self.cols:
+                self._parsed[i, j] = _parse_float(self.cells[i][j].get())
+        self._dirty.clear()
+        
+        return self._parsed.copy()
     
     def set_matrix(self, matrix: np.ndarray):
         """
@@ -430,36 +389,36 @@ class MatrixInput(ctk.CTkFrame):
         
         for i in range(min(rows, self.rows)):
             for j in range(min(cols, self.cols)):
-                self.cells[i][j].delete(0, "end")
-                self.cells[i][j].insert(0, str(matrix[i, j]))
+                text = str(matrix[i, j])
+                cell = self.cells[i][j]
+                # Only rewrite cells whose text actually changes
+                if cell.get() != text:
+                    cell.delete(0, "end")
+                    cell.insert(0, text)
     
     def get_row_headers(self) -> List[str]:
         """Get current row headers"""
         if self.editable_headers:
-            return [entry.get() for entry in self.row_header_entries]
+            return [entry.get() for entry in self.row_header_entries[:self.rows]]
         return self.row_headers
     
     def get_col_headers(self) -> List[str]:
         """Get current column headers"""
         if self.editable_headers:
-            return [entry.get() for entry in self.col_header_entries]
+            return [entry.get() for entry in self.col_header_entries[:self.cols]]
         return self.col_headers
     
     def set_row_headers(self, headers: List[str]):
         """Set row headers"""
         self.row_headers = headers
-        if self.editable_headers:
-            for i, entry in enumerate(self.row_header_entries):
-                entry.delete(0, "end")
-                entry.insert(0, headers[i] if i < len(headers) else f"R{i+1}")
+        for i, widget in enumerate(self._row_header_widgets):
+            self._set_header_text(widget, self._row_header_text(i))
     
     def set_col_headers(self, headers: List[str]):
         """Set column headers"""
         self.col_headers = headers
-        if self.editable_headers:
-            for j, entry in enumerate(self.col_header_entries):
-                entry.delete(0, "end")
-                entry.insert(0, headers[j] if j < len(headers) else f"C{j+1}")
+        for j, widget in enumerate(self._col_header_widgets):
+            self._set_header_text(widget, self._col_header_text(j))
     
     def clear(self):
         """Clear all cell values to default"""
@@ -492,26 +451,61 @@ class MatrixInput(ctk.CTkFrame):
                 self.cells[row][col].configure(fg_color=("white", "gray20"))
     
     def resize(self, rows: int, cols: int):
-        """Resize the matrix (recreates the widget)"""
+        """
+        Resize the matrix in place
+        
+        Cells inside both the old and the new shape keep their values.
+        Rows and columns beyond the new shape are hidden rather than
+        destroyed, and are shown again (reset to the default value) when
+        the matrix grows back; only cells never created before are new.
+        """
+        old_rows, old_cols = self.rows, self.cols
         self.rows = rows
         self.cols = cols
         
-        # Clear existing widgets
-        for widget in self.scroll_frame.winfo_children():
-            widget.destroy()
-        
-        self.cells = []
-        self.row_header_entries = []
-        self.col_header_entries = []
-        
         # Update headers if needed
         if len(self.row_headers) < rows:
             self.row_headers.extend([f"R{i+1}" for i in range(len(self.row_headers), rows)])
         if len(self.col_headers) < cols:
             self.col_headers.extend([f"C{j+1}" for j in range(len(self.col_headers), cols)])
         
-        # Recreate all widgets
-        self._recreate_grid_widgets()
+        built_rows = len(self.cells)
+        built_cols = len(self._col_header_widgets)
+        
+        # Hide rows and columns past the new shape
+        for i in range(rows, min(old_rows, built_rows)):
+            self._row_header_widgets[i].grid_remove()
+            for cell in self.cells[i][:old_cols]:
+                cell.grid_remove()
+        for j in range(cols, min(old_cols, built_cols)):
+            self._col_header_widgets[j].grid_remove()
+            for cell_row in self.cells[:min(old_rows, rows)]:
+                cell_row[j].grid_remove()
+        
+        # Show columns that were hidden, then create the missing ones
+        for j in range(old_cols, min(cols, built_cols)):
+            self._set_header_text(self._col_header_widgets[j], self._col_header_text(j))
+            self._col_header_widgets[j].grid(row=0, column=j+1, padx=1, pady=1)
+        for j in range(built_cols, cols):
+            self._create_col_header(j)
+        
+        # Show or create the cells of every visible row
+        for i in range(rows):
+            if i >= built_rows:
+                self._create_row_header(i)
+                self.cells.append([])
+            elif i >= old_rows:
+                self._set_header_text(self._row_header_widgets[i], self._row_header_text(i))
+                self._row_header_widgets[i].grid(row=i+1, column=0, padx=1, pady=1)
+            
+            cell_row = self.cells[i]
+            shown = old_cols if i < old_rows else 0
+            for j in range(shown, min(cols, len(cell_row))):
+                cell_row[j].delete(0, "end")
+                cell_row[j].insert(0, self.default_value)
+                cell_row[j].grid(row=i+1, column=j+1, padx=1, pady=1)
+            for j in range(len(cell_row), cols):
+                cell_row.append(self._create_cell(i, j))
 
 
 class VectorInput(ctk.CTkFrame):
@@ -541,7 +535,13 @@ class VectorInput(ctk.CTkFrame):
         self.labels = labels or [f"V{i+1}" for i in range(size)]
         self.title = title
         
+        # Items hidden by a shrinking resize stay here (past self.size) for reuse
         self.entries: List[ctk.CTkEntry] = []
+        self._labels: List[ctk.CTkLabel] = []
+        
+        # Parsed values, re-read only for the entries listed in _dirty
+        self._parsed = np.zeros(0)
+        self._dirty = set()
         
         self._create_widgets()
     
@@ -573,52 +573,98 @@ class VectorInput(ctk.CTkFrame):
             )
             container.pack(fill="both", expand=True, padx=5, pady=5)
         
+        self._container = container
         for i in range(self.size):
-            if self.orientation == "horizontal":
-                col = i
-                row = 0
-            else:
-                col = 0
-                row = i
-            
-            # Label
-            label = ctk.CTkLabel(
-                container,
-                text=self.labels[i][:10] if i < len(self.labels) else f"V{i+1}",
-                width=self.cell_width,
-                font=ctk.CTkFont(size=11)
-            )
-            
-            if self.orientation == "horizontal":
-                label.grid(row=0, column=col, padx=2, pady=2)
-            else:
-                label.grid(row=row, column=0, padx=2, pady=2, sticky="w")
-            
-            # Entry
-            entry = ctk.CTkEntry(
-                container,
-                width=self.cell_width,
-                height=self.cell_height,
-                justify="center"
-            )
-            entry.insert(0, self.default_value)
-            
-            if self.orientation == "horizontal":
-                entry.grid(row=1, column=col, padx=2, pady=2)
-            else:
-                entry.grid(row=row, column=1, padx=2, pady=2)
-            
-            self.entries.append(entry)
+            self._create_item(i)
+    
+    def _grid_item(self, i: int):
+        """Grid the label and entry of item i"""
+        if self.orientation == "horizontal":
+            self._labels[i].grid(row=0, column=i, padx=2, pady=2)
+            self.entries[i].grid(row=1, column=i, padx=2, pady=2)
+        else:
+            self._labels[i].grid(row=i, column=0, padx=2, pady=2, sticky="w")
+            self.entries[i].grid(row=i, column=1, padx=2, pady=2)
+    
+    def _label_text(self, i: int) -> str:
+        """Text shown in the label of item i"""
+        return self.labels[i][:10] if i < len(self.labels) else f"V{i+1}"
+    
+    def _create_item(self, i: int):
+        """Create and grid the label and entry of item i"""
+        # Label
+        self._labels.append(ctk.CTkLabel(
+            self._container,
+            text=self._label_text(i),
+            width=self.cell_width,
+            font=ctk.CTkFont(size=11)
+        ))
+        
+        # Entry; the variable trace catches every edit, typed or programmatic
+        text = tk.StringVar(self)
+        text.trace_add("write", lambda *_, key=i: self._dirty.add(key))
+        entry = ctk.CTkEntry(
+            self._container,
+            width=self.cell_width,
+            height=self.cell_height,
+            justify="center",
+            textvariable=text
+        )
+        entry.insert(0, self.default_value)
+        self.entries.append(entry)
+        
+        self._grid_item(i)
+    
+    def resize(self, size: int, labels: Optional[List[str]] = None):
+        """
+        Resize the vector in place
+        
+        Entries inside both the old and the new size keep their values.
+        Items past the new size are hidden rather than destroyed, and are
+        shown again (reset to the default value) when the vector grows back.
+        """
+        old_size = self.size
+        self.size = size
+        if labels is not None:
+            self.labels = labels
+            for i in range(min(old_size, size)):
+                self._labels[i].configure(text=self._label_text(i))
+        
+        for i in range(size, old_size):
+            self._labels[i].grid_remove()
+            self.entries[i].grid_remove()
+        
+        for i in range(old_size, min(size, len(self.entries))):
+            self._labels[i].configure(text=self._label_text(i))
+            self.entries[i].delete(0, "end")
+            self.entries[i].insert(0, self.default_value)
+            self._grid_item(i)
+        for i in range(len(self.entries), size):
+            self._create_item(i)
     
     def get_values(self) -> np.ndarray:
-        """Get values as numpy array"""
-        values = np.zeros(self.size)
-        for i, entry in enumerate(self.entries):
-            try:
-                values[i] = float(entry.get())
-            except ValueError:
-                values[i] = 0.0
-        return values
+        """Get values as numpy array, re-parsing only entries edited since the last call"""
+        self._refresh_parsed()
+        return self._parsed.copy()
+    
+    def total(self) -> float:
+        """Sum of the values, without copying them out"""
+        self._refresh_parsed()
+        return float(self._parsed.sum())
+    
+    def _refresh_parsed(self):
+        """Bring the parsed cache up to date with the entries"""
+        if len(self._parsed) != self.size:
+            # Entries new to the size were all written by resize, so they are dirty
+            parsed = np.zeros(self.size)
+            count = min(self.size, len(self._parsed))
+            parsed[:count] = self._parsed[:count]
+            self._parsed = parsed
+        
+        for i in self._dirty:
+            if i < self.size:
+                self._parsed[i] = _parse_float(self.entries[i].get())
+        self._dirty.clear()
     
     def set_values(self, values: np.ndarray):
         """Set values from numpy array"""
@@ -628,6 +674,6 @@ class VectorInput(ctk.CTkFrame):
     
     def clear(self):
         """Clear all values"""
-        for entry in self.entries:
+        for entry in self.entries[:self.size]:
             entry.delete(0, "end")
             entry.insert(0, self.default_value)
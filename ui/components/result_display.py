@@ -5,11 +5,34 @@ Formatted display for solution results with highlighting
 
 import customtkinter as ctk
 import tkinter as tk
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import numpy as np
 
 # Import ScrollableFrame from matrix_input
 from ui.components.matrix_input import ScrollableFrame
+from models.lp_model import LPResult
+
+# Allocation matrix colours: header background, and (fg_color, text_color)
+# pairs indexed by a cell's highlight flag (False -> plain, True -> highlighted)
+_HEADER_FG = ("gray80", "gray30")
+_CELL_COLORS = (
+    (("white", "gray20"), ("black", "white")),
+    (("#4CAF50", "#2E7D32"), "white")
+)
+
+# Shared fonts keyed by (family, size, weight); created lazily because a
+# CTkFont needs an existing Tk root
+_FONT_CACHE: Dict[tuple, ctk.CTkFont] = {}
+
+
+def _get_font(size: int, weight: str = "normal", family: Optional[str] = None) -> ctk.CTkFont:
+    """Return a cached CTkFont, creating it on first use"""
+    key = (family, size, weight)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = ctk.CTkFont(family=family, size=size, weight=weight)
+        _FONT_CACHE[key] = font
+    return font
 
 
 class ResultDisplay(ctk.CTkFrame):
@@ -32,6 +55,7 @@ class ResultDisplay(ctk.CTkFrame):
         super().__init__(parent, **kwargs)
         
         self.title = title
+        self._last_text: Optional[str] = None
         self._create_widgets()
     
     def _create_widgets(self):
@@ -40,7 +64,7 @@ class ResultDisplay(ctk.CTkFrame):
         self.title_label = ctk.CTkLabel(
             self,
             text=self.title,
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_get_font(16, "bold")
         )
         self.title_label.pack(pady=(10, 5))
         
@@ -51,7 +75,7 @@ class ResultDisplay(ctk.CTkFrame):
         self.status_indicator = ctk.CTkLabel(
             self.status_frame,
             text="●",
-            font=ctk.CTkFont(size=20),
+            font=_get_font(20),
             text_color="gray"
         )
         self.status_indicator.pack(side="left", padx=5)
@@ -59,24 +83,18 @@ class ResultDisplay(ctk.CTkFrame):
         self.status_label = ctk.CTkLabel(
             self.status_frame,
             text="No solution yet",
-            font=ctk.CTkFont(size=14)
+            font=_get_font(14)
         )
         self.status_label.pack(side="left", padx=5)
         
-        # Main content area
-        self.content_frame = ctk.CTkScrollableFrame(
-            self,
-            height=300
-        )
-        self.content_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        # Text display
+        # Text display (CTkTextbox scrolls on its own)
         self.text_display = ctk.CTkTextbox(
-            self.content_frame,
-            height=250,
-            font=ctk.CTkFont(family="Consolas", size=12)
+            self,
+            height=300,
+            font=_get_font(12, family="Consolas"),
+            state="disabled"
         )
-        self.text_display.pack(fill="both", expand=True)
+        self.text_display.pack(fill="both", expand=True, padx=10, pady=10)
     
     def set_status(self, success: bool, message: str = ""):
         """Set the status indicator"""
@@ -88,11 +106,18 @@ class ResultDisplay(ctk.CTkFrame):
             self.status_label.configure(text=message or "No Feasible Solution")
     
     def display_text(self, text: str):
-        """Display plain text content"""
+        """Display plain text content (skipped when unchanged)"""
+        if text == self._last_text:
+            return
+        self._last_text = text
+        
+        # The textbox is kept read-only between updates
+        self.text_display.configure(state="normal")
         self.text_display.delete("1.0", "end")
         self.text_display.insert("1.0", text)
+        self.text_display.configure(state="disabled")
     
-    def display_lp_result(self, result: Dict[str, Any], variable_names: List[str] = None):
+    def display_lp_result(self, result: LPResult, variable_names: List[str] = None):
         """Display Linear Programming result"""
         lines = []
         
@@ -100,17 +125,17 @@ class ResultDisplay(ctk.CTkFrame):
         lines.append("LINEAR PROGRAMMING SOLUTION")
         lines.append("=" * 50)
         
-        if result.get('success', False):
+        if result.success:
             self.set_status(True, "Optimal Solution Found")
             
-            lines.append(f"\nOptimal Value: {result.get('optimal_value', 0):,.4f}")
-            lines.append(f"Iterations: {result.get('iterations', 0)}")
+            lines.append(f"\nOptimal Value: {result.optimal_value:,.4f}")
+            lines.append(f"Iterations: {result.iterations}")
             
             lines.append("\n" + "-" * 40)
             lines.append("DECISION VARIABLES")
             lines.append("-" * 40)
             
-            solution = result.get('solution', [])
+            solution = result.solution
             names = variable_names or [f"x{i+1}" for i in range(len(solution))]
             
             for i, val in enumerate(solution):
@@ -118,22 +143,22 @@ class ResultDisplay(ctk.CTkFrame):
                 lines.append(f"  {name:.<30} {val:>12.4f}")
             
             # Sensitivity Analysis
-            if 'shadow_prices' in result and len(result['shadow_prices']) > 0:
+            if len(result.shadow_prices) > 0:
                 lines.append("\n" + "-" * 40)
                 lines.append("SENSITIVITY ANALYSIS")
                 lines.append("-" * 40)
                 
                 lines.append("\nShadow Prices:")
-                for i, sp in enumerate(result['shadow_prices']):
+                for i, sp in enumerate(result.shadow_prices):
                     lines.append(f"  Constraint {i+1}: {sp:>12.4f}")
                 
-                if 'slack_values' in result:
+                if len(result.slack_values) > 0:
                     lines.append("\nSlack/Surplus Values:")
-                    for i, sv in enumerate(result['slack_values']):
+                    for i, sv in enumerate(result.slack_values):
                         lines.append(f"  Constraint {i+1}: {sv:>12.4f}")
         else:
-            self.set_status(False, result.get('message', 'No solution'))
-            lines.append(f"\nStatus: {result.get('message', 'No feasible solution')}")
+            self.set_status(False, result.message or 'No solution')
+            lines.append(f"\nStatus: {result.message or 'No feasible solution'}")
         
         self.display_text("\n".join(lines))
     
@@ -162,14 +187,21 @@ class ResultDisplay(ctk.CTkFrame):
             lines.append("-" * 40)
             
             assignments = result.get('assignments', [])
-            individual_costs = result.get('individual_costs', [])
+            individual_costs = list(result.get('individual_costs', []))
             
-            for i, (r, c) in enumerate(assignments):
-                row_name = row_names[r] if row_names and r < len(row_names) else f"Worker {r+1}"
-                col_name = col_names[c] if col_names and c < len(col_names) else f"Task {c+1}"
-                cost = individual_costs[i] if i < len(individual_costs) else 0
-                
-                lines.append(f"  {row_name:.<20} → {col_name:.<15} ({obj_type}: {cost:.0f})")
+            # Resolve labels and pad costs once instead of bounds-checking per line
+            row_labels = list(row_names or [])
+            col_labels = list(col_names or [])
+            max_row = max((r for r, _ in assignments), default=-1)
+            max_col = max((c for _, c in assignments), default=-1)
+            row_labels += [f"Worker {r+1}" for r in range(len(row_labels), max_row + 1)]
+            col_labels += [f"Task {c+1}" for c in range(len(col_labels), max_col + 1)]
+            individual_costs += [0] * (len(assignments) - len(individual_costs))
+            
+            lines.extend(
+                f"  {row_labels[r]:.<20} → {col_labels[c]:.<15} ({obj_type}: {cost:.0f})"
+                for (r, c), cost in zip(assignments, individual_costs)
+            )
         else:
             self.set_status(False, result.get('message', 'No solution'))
             lines.append(f"\nStatus: {result.get('message', 'No feasible solution')}")
@@ -223,7 +255,10 @@ class ResultDisplay(ctk.CTkFrame):
         """Clear the display"""
         self.status_indicator.configure(text_color="gray")
         self.status_label.configure(text="No solution yet")
+        self._last_text = None
+        self.text_display.configure(state="normal")
         self.text_display.delete("1.0", "end")
+        self.text_display.configure(state="disabled")
 
 
 class AllocationMatrixDisplay(ctk.CTkFrame):
@@ -240,6 +275,13 @@ class AllocationMatrixDisplay(ctk.CTkFrame):
         super().__init__(parent, **kwargs)
         
         self.title = title
+        
+        # Label pool keyed by (grid row, grid column); reused across displays
+        self._labels: Dict[Tuple[int, int], ctk.CTkLabel] = {}
+        self._label_state: Dict[Tuple[int, int], tuple] = {}
+        self._hidden = False
+        self._grid_shape = (0, 0)
+        
         self._create_widgets()
     
     def _create_widgets(self):
@@ -247,7 +289,7 @@ class AllocationMatrixDisplay(ctk.CTkFrame):
         self.title_label = ctk.CTkLabel(
             self,
             text=self.title,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_get_font(14, "bold")
         )
         self.title_label.pack(pady=(5, 10))
         
@@ -260,6 +302,59 @@ class AllocationMatrixDisplay(ctk.CTkFrame):
         self.scroll_container.pack(fill="both", expand=True, padx=5, pady=5)
         self.matrix_frame = self.scroll_container.get_inner_frame()
     
+    def _show_label(
+        self,
+        row: int,
+        column: int,
+        static: Dict[str, Any],
+        text: str,
+        fg_color: Any,
+        text_color: Any = None
+    ):
+        """Show a label at a grid position, creating it only on first use"""
+        key = (row, column)
+        state = (text, fg_color, text_color)
+        label = self._labels.get(key)
+        
+        options = {"text": text, "fg_color": fg_color}
+        if text_color is not None:
+            options["text_color"] = text_color
+        
+        if label is None:
+            label = ctk.CTkLabel(self.matrix_frame, **options, **static)
+            label.grid(row=row, column=column, padx=1, pady=1)
+            self._labels[key] = label
+        else:
+            if self._label_state.get(key) != state:
+                label.configure(**options)
+            if self._hidden:
+                label.grid()
+        
+        self._label_state[key] = state
+    
+    def _trim_pool(self, rows: int, cols: int):
+        """Destroy pooled labels that fall outside a rows x cols matrix"""
+        for key in [k for k in self._labels if k[0] > rows or k[1] > cols]:
+            self._labels.pop(key).destroy()
+            self._label_state.pop(key, None)
+    
+    def _configure_grid(self, rows: int, cols: int, cell_width: int, cell_height: int):
+        """Fix grid row/column sizes up front so cells are not re-measured one by one"""
+        if self._grid_shape == (rows, cols):
+            return
+        
+        old_rows, old_cols = self._grid_shape
+        for i in range(rows + 1, old_rows + 1):
+            self.matrix_frame.grid_rowconfigure(i, minsize=0)
+        for j in range(cols + 1, old_cols + 1):
+            self.matrix_frame.grid_columnconfigure(j, minsize=0)
+        
+        self.matrix_frame.grid_rowconfigure(tuple(range(rows + 1)), minsize=cell_height + 2)
+        self.matrix_frame.grid_columnconfigure(0, minsize=82)
+        if cols:
+            self.matrix_frame.grid_columnconfigure(tuple(range(1, cols + 1)), minsize=cell_width + 2)
+        self._grid_shape = (rows, cols)
+    
     def display_matrix(
         self,
         matrix: np.ndarray,
@@ -268,80 +363,81 @@ class AllocationMatrixDisplay(ctk.CTkFrame):
         col_names: List[str] = None,
         highlight_nonzero: bool = True
     ):
-        """Display a matrix with optional highlighting"""
-        # Clear existing widgets
-        for widget in self.matrix_frame.winfo_children():
-            widget.destroy()
+        """
+        Display a matrix with optional highlighting
         
+        Labels from the previous display are reconfigured in place; only
+        cells added or dropped by a change in shape are created or destroyed.
+        """
         rows, cols = matrix.shape
-        row_names = row_names or [f"R{i+1}" for i in range(rows)]
-        col_names = col_names or [f"C{j+1}" for j in range(cols)]
+        row_names = list(row_names or [])
+        col_names = list(col_names or [])
+        
+        # Truncated header text, padded with defaults, computed once
+        row_headers = [name[:10] for name in row_names[:rows]]
+        row_headers += [f"R{i+1}" for i in range(len(row_headers), rows)]
+        col_headers = [name[:8] for name in col_names[:cols]]
+        col_headers += [f"C{j+1}" for j in range(len(col_headers), cols)]
         
         cell_width = 70
         cell_height = 30
         
+        # Format cells and decide highlights in vectorized passes. Allocation
+        # matrices are mostly zero, so only the cells that are shown get formatted
+        if cost_matrix is not None:
+            shown = matrix > 0
+            texts = np.full(matrix.shape, "", dtype=object)
+            texts[shown] = np.char.mod("%.0f", matrix[shown])
+        else:
+            texts = np.char.mod("%.0f", matrix)
+        highlighted = (matrix > 0.001) & highlight_nonzero
+        
+        # Plain Python rows (str / bool) for the render loop
+        text_rows = texts.tolist()
+        highlight_rows = highlighted.tolist()
+        
+        # Shared widget options, built once per display
+        header_font = _get_font(10, "bold")
+        header_fg = _HEADER_FG
+        cell_colors = _CELL_COLORS
+        
+        corner_static = {"width": 80, "height": cell_height}
+        col_header_static = {
+            "width": cell_width, "height": cell_height,
+            "font": header_font, "corner_radius": 3
+        }
+        row_header_static = {
+            "width": 80, "height": cell_height,
+            "font": header_font, "corner_radius": 3
+        }
+        cell_static = {"width": cell_width, "height": cell_height, "corner_radius": 3}
+        
+        self._trim_pool(rows, cols)
+        self._configure_grid(rows, cols, cell_width, cell_height)
+        
         # Corner cell
-        ctk.CTkLabel(
-            self.matrix_frame,
-            text="",
-            width=80,
-            height=cell_height
-        ).grid(row=0, column=0)
+        self._show_label(0, 0, corner_static, "", "transparent")
         
         # Column headers
-        for j, name in enumerate(col_names):
-            ctk.CTkLabel(
-                self.matrix_frame,
-                text=name[:8],
-                width=cell_width,
-                height=cell_height,
-                font=ctk.CTkFont(size=10, weight="bold"),
-                fg_color=("gray80", "gray30"),
-                corner_radius=3
-            ).grid(row=0, column=j+1, padx=1, pady=1)
+        for j, name in enumerate(col_headers):
+            self._show_label(0, j+1, col_header_static, name, header_fg)
         
         # Rows
         for i in range(rows):
             # Row header
-            ctk.CTkLabel(
-                self.matrix_frame,
-                text=row_names[i][:10] if i < len(row_names) else f"R{i+1}",
-                width=80,
-                height=cell_height,
-                font=ctk.CTkFont(size=10, weight="bold"),
-                fg_color=("gray80", "gray30"),
-                corner_radius=3
-            ).grid(row=i+1, column=0, padx=1, pady=1)
+            self._show_label(i+1, 0, row_header_static, row_headers[i], header_fg)
             
             # Data cells
+            row_texts = text_rows[i]
+            row_highlights = highlight_rows[i]
             for j in range(cols):
-                value = matrix[i, j]
-                
-                # Format display text
-                if cost_matrix is not None:
-                    text = f"{value:.0f}" if value > 0 else ""
-                else:
-                    text = f"{value:.0f}"
-                
-                # Determine colors
-                if highlight_nonzero and value > 0.001:
-                    fg_color = ("#4CAF50", "#2E7D32")
-                    text_color = "white"
-                else:
-                    fg_color = ("white", "gray20")
-                    text_color = ("black", "white")
-                
-                ctk.CTkLabel(
-                    self.matrix_frame,
-                    text=text,
-                    width=cell_width,
-                    height=cell_height,
-                    fg_color=fg_color,
-                    text_color=text_color,
-                    corner_radius=3
-                ).grid(row=i+1, column=j+1, padx=1, pady=1)
+                fg_color, text_color = cell_colors[row_highlights[j]]
+                self._show_label(i+1, j+1, cell_static, row_texts[j], fg_color, text_color)
+        
+        self._hidden = False
     
     def clear(self):
-        """Clear the display"""
-        for widget in self.matrix_frame.winfo_children():
-            widget.destroy()
+        """Clear the display (pooled labels are hidden, not destroyed)"""
+        for label in self._labels.values():
+            label.grid_remove()
+        self._hidden = True
@@ -4,13 +4,10 @@ Displays sensitivity analysis results in tabular format
 """
 
 import customtkinter as ctk
-import tkinter as tk
-from typing import List, Dict, Any, Optional
+from tkinter import ttk
+from typing import List, Dict, Any, Optional, Sequence
 import numpy as np
 
-# Import ScrollableFrame for horizontal scrolling support
-from ui.components.matrix_input import ScrollableFrame
-
 
 class SensitivityTable(ctk.CTkFrame):
     """
@@ -23,6 +20,20 @@ class SensitivityTable(ctk.CTkFrame):
     - Slack values
     """
     
+    # Treeview colours as (light, dark) appearance-mode pairs
+    TREE_STYLE = "Sensitivity.Treeview"
+    TREE_COLORS = {
+        "background": ("white", "gray20"),
+        "foreground": ("black", "gray90"),
+        "heading_background": ("gray85", "gray30"),
+        "heading_foreground": ("black", "gray90"),
+    }
+    # Alternating row (background, foreground) colours
+    ROW_COLORS = {
+        "even": (("gray95", "black"), ("gray25", "gray90")),
+        "odd": (("white", "black"), ("gray20", "gray90")),
+    }
+    
     def __init__(
         self,
         parent,
@@ -32,6 +43,13 @@ class SensitivityTable(ctk.CTkFrame):
         super().__init__(parent, **kwargs)
         
         self.title = title
+        
+        # Report shown by display_full_analysis and the tabs already filled from it
+        self._pending_report: Optional[Dict[str, Any]] = None
+        self._rendered_tabs = set()
+        # Per tab, a key of the data it currently shows (value bytes, names)
+        self._last_keys: Dict[str, tuple] = {}
+        
         self._create_widgets()
     
     def _create_widgets(self):
@@ -45,7 +63,7 @@ class SensitivityTable(ctk.CTkFrame):
         self.title_label.pack(pady=(10, 5))
         
         # Tab view for different sections
-        self.tabview = ctk.CTkTabview(self, height=350)
+        self.tabview = ctk.CTkTabview(self, height=350, command=self._on_tab_changed)
         self.tabview.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Create tabs
@@ -54,47 +72,97 @@ class SensitivityTable(ctk.CTkFrame):
         self.tabview.add("Constraint Ranges")
         self.tabview.add("Variable Ranges")
         
-        # Create scrollable frames with horizontal scrolling in each tab
-        self.shadow_container = ScrollableFrame(self.tabview.tab("Shadow Prices"), width=450, height=250)
-        self.shadow_container.pack(fill="both", expand=True)
-        self.shadow_frame = self.shadow_container.get_inner_frame()
-        
-        self.reduced_container = ScrollableFrame(self.tabview.tab("Reduced Costs"), width=450, height=250)
-        self.reduced_container.pack(fill="both", expand=True)
-        self.reduced_frame = self.reduced_container.get_inner_frame()
-        
-        self.constraint_container = ScrollableFrame(self.tabview.tab("Constraint Ranges"), width=450, height=250)
-        self.constraint_container.pack(fill="both", expand=True)
-        self.constraint_frame = self.constraint_container.get_inner_frame()
-        
-        self.variable_container = ScrollableFrame(self.tabview.tab("Variable Ranges"), width=450, height=250)
-        self.variable_container.pack(fill="both", expand=True)
-        self.variable_frame = self.variable_container.get_inner_frame()
-    
-    def _create_table_header(self, parent, columns: List[str]):
-        """Create a table header row"""
-        for j, col in enumerate(columns):
-            ctk.CTkLabel(
-                parent,
-                text=col,
-                font=ctk.CTkFont(weight="bold"),
-                fg_color=("gray80", "gray30"),
-                corner_radius=3,
-                width=120
-            ).grid(row=0, column=j, padx=2, pady=2, sticky="ew")
-    
-    def _create_table_row(self, parent, row_idx: int, values: List[str]):
-        """Create a table data row"""
-        for j, val in enumerate(values):
-            # Alternate row colors
-            fg_color = ("gray95", "gray25") if row_idx % 2 == 0 else ("white", "gray20")
-            
-            ctk.CTkLabel(
-                parent,
-                text=str(val),
-                fg_color=fg_color,
-                width=120
-            ).grid(row=row_idx + 1, column=j, padx=2, pady=1, sticky="ew")
+        # One native Treeview per tab; Tk only draws the visible rows
+        self.shadow_tree = self._create_tree(
+            self.tabview.tab("Shadow Prices"),
+            ["Constraint", "Shadow Price", "Slack/Surplus", "Status"]
+        )
+        self.reduced_tree = self._create_tree(
+            self.tabview.tab("Reduced Costs"),
+            ["Variable", "Value", "Reduced Cost", "Status"]
+        )
+        self.constraint_tree = self._create_tree(
+            self.tabview.tab("Constraint Ranges"),
+            ["Constraint", "Current RHS", "Shadow Price", "Allow. Increase", "Allow. Decrease"]
+        )
+        self.variable_tree = self._create_tree(
+            self.tabview.tab("Variable Ranges"),
+            ["Variable", "Current Coeff", "Value", "Allow. Increase", "Allow. Decrease"]
+        )
+        
+        self._apply_tree_colors()
+    
+    def _create_tree(self, parent, columns: List[str]) -> ttk.Treeview:
+        """Create a report-style Treeview with scrollbars in the given tab"""
+        frame = ctk.CTkFrame(parent, fg_color="transparent")
+        frame.pack(fill="both", expand=True)
+        frame.grid_rowconfigure(0, weight=1)
+        frame.grid_columnconfigure(0, weight=1)
+        
+        tree = ttk.Treeview(frame, columns=columns, show="headings", height=10, style=self.TREE_STYLE)
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=120, minwidth=80, anchor="center")
+        
+        v_scrollbar = ttk.Scrollbar(frame, orient="vertical", command=tree.yview)
+        h_scrollbar = ttk.Scrollbar(frame, orient="horizontal", command=tree.xview)
+        tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        
+        tree.grid(row=0, column=0, sticky="nsew")
+        v_scrollbar.grid(row=0, column=1, sticky="ns")
+        h_scrollbar.grid(row=1, column=0, sticky="ew")
+        
+        return tree
+    
+    def _fill_tree(self, tree: ttk.Treeview, rows: List[Sequence[str]]):
+        """Replace the contents of a Treeview with the given rows"""
+        tree.delete(*tree.get_children())
+        for i, values in enumerate(rows):
+            tree.insert("", "end", values=values, tags=("even" if i % 2 == 0 else "odd",))
+    
+    def _apply_tree_colors(self):
+        """Colour the Treeviews and their row tags for the current appearance mode"""
+        mode = 1 if self._get_appearance_mode() == "dark" else 0
+        colors = {key: pair[mode] for key, pair in self.TREE_COLORS.items()}
+        
+        style = ttk.Style(self)
+        style.configure(
+            self.TREE_STYLE,
+            background=colors["background"],
+            fieldbackground=colors["background"],
+            foreground=colors["foreground"]
+        )
+        style.configure(
+            f"{self.TREE_STYLE}.Heading",
+            background=colors["heading_background"],
+            foreground=colors["heading_foreground"]
+        )
+        
+        for tree in (self.shadow_tree, self.reduced_tree, self.constraint_tree, self.variable_tree):
+            for tag, pairs in self.ROW_COLORS.items():
+                background, foreground = pairs[mode]
+                tree.tag_configure(tag, background=background, foreground=foreground)
+    
+    def _set_appearance_mode(self, mode_string: str):
+        """Re-colour the Treeviews when the appearance mode changes"""
+        super()._set_appearance_mode(mode_string)
+        self._apply_tree_colors()
+    
+    @staticmethod
+    def _padded(values, n: int) -> np.ndarray:
+        """Return values as a float array of length n, zero-filled past its end"""
+        arr = np.zeros(n)
+        if values is not None:
+            values = np.asarray(values, dtype=float)[:n]
+            arr[:len(values)] = values
+        return arr
+    
+    @staticmethod
+    def _padded_names(names: Optional[List[str]], n: int, prefix: str) -> List[str]:
+        """Return n display names, falling back to prefix + index"""
+        names = list(names or [])[:n]
+        names.extend(f"{prefix}{i+1}" for i in range(len(names), n))
+        return [name[:20] for name in names]
     
     def display_shadow_prices(
         self,
@@ -103,32 +171,17 @@ class SensitivityTable(ctk.CTkFrame):
         constraint_names: List[str] = None
     ):
         """Display shadow prices and slack values"""
-        # Clear existing
-        for widget in self.shadow_frame.winfo_children():
-            widget.destroy()
-        
-        # Create header
-        columns = ["Constraint", "Shadow Price", "Slack/Surplus", "Status"]
-        self._create_table_header(self.shadow_frame, columns)
-        
-        # Add data rows
         n = len(shadow_prices)
-        names = constraint_names or [f"Constraint {i+1}" for i in range(n)]
-        slacks = slack_values if slack_values is not None else np.zeros(n)
+        names = self._padded_names(constraint_names, n, "Constraint ")
+        slacks = self._padded(slack_values, n)
         
-        for i in range(n):
-            name = names[i] if i < len(names) else f"Constraint {i+1}"
-            sp = shadow_prices[i]
-            slack = slacks[i] if i < len(slacks) else 0
-            
-            # Determine binding status
-            if abs(slack) < 1e-6:
-                status = "Binding"
-            else:
-                status = "Non-binding"
-            
-            values = [name[:20], f"{sp:,.4f}", f"{slack:,.4f}", status]
-            self._create_table_row(self.shadow_frame, i, values)
+        # Binding status and formatting for all rows at once
+        statuses = np.where(np.abs(slacks) < 1e-6, "Binding", "Non-binding").tolist()
+        sp_strs = [f"{sp:,.4f}" for sp in np.asarray(shadow_prices, dtype=float).tolist()]
+        slack_strs = [f"{slack:,.4f}" for slack in slacks.tolist()]
+        
+        rows = list(zip(names, sp_strs, slack_strs, statuses))
+        self._fill_tree(self.shadow_tree, rows)
     
     def display_reduced_costs(
         self,
@@ -137,117 +190,149 @@ class SensitivityTable(ctk.CTkFrame):
         variable_names: List[str] = None
     ):
         """Display reduced costs"""
-        # Clear existing
-        for widget in self.reduced_frame.winfo_children():
-            widget.destroy()
-        
-        # Create header
-        columns = ["Variable", "Value", "Reduced Cost", "Status"]
-        self._create_table_header(self.reduced_frame, columns)
-        
-        # Add data rows
         n = len(reduced_costs)
-        names = variable_names or [f"x{i+1}" for i in range(n)]
-        values_arr = solution if solution is not None else np.zeros(n)
+        names = self._padded_names(variable_names, n, "x")
+        values_arr = self._padded(solution, n)
         
-        for i in range(n):
-            name = names[i] if i < len(names) else f"x{i+1}"
-            val = values_arr[i] if i < len(values_arr) else 0
-            rc = reduced_costs[i]
-            
-            # Determine status
-            if val > 1e-6:
-                status = "Basic"
-            else:
-                status = "Non-basic"
-            
-            row_values = [name[:20], f"{val:,.4f}", f"{rc:,.4f}", status]
-            self._create_table_row(self.reduced_frame, i, row_values)
+        # Basis status and formatting for all rows at once
+        statuses = np.where(values_arr > 1e-6, "Basic", "Non-basic").tolist()
+        val_strs = [f"{val:,.4f}" for val in values_arr.tolist()]
+        rc_strs = [f"{rc:,.4f}" for rc in np.asarray(reduced_costs, dtype=float).tolist()]
+        
+        rows = list(zip(names, val_strs, rc_strs, statuses))
+        self._fill_tree(self.reduced_tree, rows)
+    
+    @staticmethod
+    def _range_column(ranges: List[Dict], key: str, default: float) -> np.ndarray:
+        """Collect one numeric field of a list of range dicts into a float array"""
+        return np.fromiter(
+            (r.get(key, default) for r in ranges), dtype=np.float64, count=len(ranges)
+        )
+    
+    @staticmethod
+    def _format_column(values: np.ndarray, spec: str, show_infinity: bool = False) -> List[str]:
+        """Format a float array, optionally showing +inf entries as "∞" """
+        strs = [format(v, spec) for v in values.tolist()]
+        if show_infinity:
+            for i in np.flatnonzero(np.isposinf(values)).tolist():
+                strs[i] = "∞"
+        return strs
     
     def display_constraint_ranges(self, ranges: List[Dict]):
         """Display allowable ranges for constraint RHS values"""
-        # Clear existing
-        for widget in self.constraint_frame.winfo_children():
-            widget.destroy()
-        
-        # Create header
-        columns = ["Constraint", "Current RHS", "Shadow Price", "Allow. Increase", "Allow. Decrease"]
-        self._create_table_header(self.constraint_frame, columns)
-        
-        # Add data rows
-        for i, r in enumerate(ranges):
-            name = r.get('name', f"Constraint {i+1}")[:15]
-            current = r.get('current_rhs', 0)
-            sp = r.get('shadow_price', 0)
-            inc = r.get('allowable_increase', float('inf'))
-            dec = r.get('allowable_decrease', 0)
-            
-            inc_str = "∞" if inc == float('inf') else f"{inc:,.2f}"
-            dec_str = f"{dec:,.2f}"
-            
-            values = [name, f"{current:,.2f}", f"{sp:,.4f}", inc_str, dec_str]
-            self._create_table_row(self.constraint_frame, i, values)
+        names = [r.get('name', f"Constraint {i+1}")[:15] for i, r in enumerate(ranges)]
+        currents = self._range_column(ranges, 'current_rhs', 0)
+        sps = self._range_column(ranges, 'shadow_price', 0)
+        incs = self._range_column(ranges, 'allowable_increase', float('inf'))
+        decs = self._range_column(ranges, 'allowable_decrease', 0)
+        
+        rows = list(zip(
+            names,
+            self._format_column(currents, ",.2f"),
+            self._format_column(sps, ",.4f"),
+            self._format_column(incs, ",.2f", show_infinity=True),
+            self._format_column(decs, ",.2f")
+        ))
+        self._fill_tree(self.constraint_tree, rows)
     
     def display_variable_ranges(self, ranges: List[Dict]):
         """Display allowable ranges for objective coefficients"""
-        # Clear existing
-        for widget in self.variable_frame.winfo_children():
-            widget.destroy()
-        
-        # Create header
-        columns = ["Variable", "Current Coeff", "Value", "Allow. Increase", "Allow. Decrease"]
-        self._create_table_header(self.variable_frame, columns)
-        
-        # Add data rows
-        for i, r in enumerate(ranges):
-            name = r.get('name', f"x{i+1}")[:15]
-            coeff = r.get('current_coefficient', 0)
-            val = r.get('current_value', 0)
-            inc = r.get('allowable_increase', float('inf'))
-            dec = r.get('allowable_decrease', float('inf'))
-            
-            inc_str = "∞" if inc == float('inf') else f"{inc:,.2f}"
-            dec_str = "∞" if dec == float('inf') else f"{dec:,.2f}"
-            
-            values = [name, f"{coeff:,.2f}", f"{val:,.4f}", inc_str, dec_str]
-            self._create_table_row(self.variable_frame, i, values)
+        names = [r.get('name', f"x{i+1}")[:15] for i, r in enumerate(ranges)]
+        coeffs = self._range_column(ranges, 'current_coefficient', 0)
+        vals = self._range_column(ranges, 'current_value', 0)
+        incs = self._range_column(ranges, 'allowable_increase', float('inf'))
+        decs = self._range_column(ranges, 'allowable_decrease', float('inf'))
+        
+        rows = list(zip(
+            names,
+            self._format_column(coeffs, ",.2f"),
+            self._format_column(vals, ",.4f"),
+            self._format_column(incs, ",.2f", show_infinity=True),
+            self._format_column(decs, ",.2f", show_infinity=True)
+        ))
+        self._fill_tree(self.variable_tree, rows)
     
     def display_full_analysis(self, sensitivity_report: Dict[str, Any]):
-        """Display complete sensitivity analysis from a report dictionary"""
-        # Shadow prices
-        if 'shadow_prices' in sensitivity_report:
-            sp_data = sensitivity_report['shadow_prices']
+        """
+        Display complete sensitivity analysis from a report dictionary
+        
+        Only the visible tab is filled right away; the others are filled
+        the first time they are selected. A tab whose data is unchanged
+        since it was last filled is left as it is.
+        """
+        self._pending_report = sensitivity_report
+        self._rendered_tabs.clear()
+        self._render_tab(self.tabview.get())
+    
+    def _on_tab_changed(self):
+        """Fill the newly selected tab from the pending report"""
+        self._render_tab(self.tabview.get())
+    
+    def _is_unchanged(self, tab_name: str, arrays: List[np.ndarray], names: List[str]) -> bool:
+        """Record the key of the data a tab is about to show; True if the tab already shows it"""
+        key = (
+            tuple(b"" if a is None else np.asarray(a, dtype=np.float64).tobytes() for a in arrays),
+            tuple(names)
+        )
+        if self._last_keys.get(tab_name) == key:
+            return True
+        self._last_keys[tab_name] = key
+        return False
+    
+    def _render_tab(self, tab_name: str):
+        """Fill one tab from the pending report, at most once per report"""
+        report = self._pending_report
+        if report is None or tab_name in self._rendered_tabs:
+            return
+        self._rendered_tabs.add(tab_name)
+        
+        if tab_name == "Shadow Prices":
+            sp_data = report.get('shadow_prices', [])
             shadow_prices = np.array([item['value'] for item in sp_data])
             names = [item.get('name', f"C{i+1}") for i, item in enumerate(sp_data)]
             
-            slack = sensitivity_report.get('slack_values', [])
+            slack = report.get('slack_values', [])
             slack_values = np.array([item['value'] for item in slack]) if slack else None
             
-            self.display_shadow_prices(shadow_prices, slack_values, names)
+            if not self._is_unchanged(tab_name, [shadow_prices, slack_values], names):
+                self.display_shadow_prices(shadow_prices, slack_values, names)
         
-        # Reduced costs
-        if 'reduced_costs' in sensitivity_report:
-            rc_data = sensitivity_report['reduced_costs']
+        elif tab_name == "Reduced Costs":
+            rc_data = report.get('reduced_costs', [])
             reduced_costs = np.array([item['value'] for item in rc_data])
             names = [item.get('name', f"x{i+1}") for i, item in enumerate(rc_data)]
             
-            self.display_reduced_costs(reduced_costs, variable_names=names)
+            if not self._is_unchanged(tab_name, [reduced_costs], names):
+                self.display_reduced_costs(reduced_costs, variable_names=names)
         
-        # Constraint ranges
-        if 'rhs_ranges' in sensitivity_report:
-            self.display_constraint_ranges(sensitivity_report['rhs_ranges'])
+        elif tab_name == "Constraint Ranges":
+            ranges = report.get('rhs_ranges', [])
+            columns = [
+                self._range_column(ranges, key, default)
+                for key, default in (('current_rhs', 0), ('shadow_price', 0),
+                                     ('allowable_increase', float('inf')), ('allowable_decrease', 0))
+            ]
+            names = [r.get('name', '') for r in ranges]
+            
+            if not self._is_unchanged(tab_name, columns, names):
+                self.display_constraint_ranges(ranges)
         
-        # Variable ranges
-        if 'objective_ranges' in sensitivity_report:
-            self.display_variable_ranges(sensitivity_report['objective_ranges'])
+        elif tab_name == "Variable Ranges":
+            ranges = report.get('objective_ranges', [])
+            columns = [
+                self._range_column(ranges, key, default)
+                for key, default in (('current_coefficient', 0), ('current_value', 0),
+                                     ('allowable_increase', float('inf')), ('allowable_decrease', float('inf')))
+            ]
+            names = [r.get('name', '') for r in ranges]
+            
+            if not self._is_unchanged(tab_name, columns, names):
+                self.display_variable_ranges(ranges)
     
     def clear(self):
         """Clear all tables"""
-        for widget in self.shadow_frame.winfo_children():
-            widget.destroy()
-        for widget in self.reduced_frame.winfo_children():
-            widget.destroy()
-        for widget in self.constraint_frame.winfo_children():
-            widget.destroy()
-        for widget in self.variable_frame.winfo_children():
-            widget.destroy()
+        self._pending_report = None
+        self._rendered_tabs.clear()
+        self._last_keys.clear()
+        for tree in (self.shadow_tree, self.reduced_tree, self.constraint_tree, self.variable_tree):
+            tree.delete(*tree.get_children())
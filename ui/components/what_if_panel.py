@@ -5,10 +5,12 @@ Interactive panel for sensitivity analysis with add/remove constraints and varia
 
 import customtkinter as ctk
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, ttk
 from typing import Dict, Any, List, Optional, Callable
 import numpy as np
 
+from models.lp_model import LPResult
+
 try:
     from config.settings import COLORS, FONTS
 except ImportError:
@@ -31,6 +33,18 @@ class WhatIfPanel(ctk.CTkFrame):
     - Sensitivity range visualization
     """
     
+    # Removed variables that can be restored, and how long the undo bar stays
+    UNDO_LIMIT = 10
+    UNDO_TIMEOUT_MS = 8000
+    
+    # Variable/constraint list rows kept as widgets, and the height and gap of each row
+    LIST_WINDOW = 30
+    LIST_ROW_HEIGHT = 44
+    LIST_ROW_GAP = 6
+    
+    # Apply requests made within this window are handled together
+    APPLY_DEBOUNCE_MS = 200
+    
     def __init__(
         self,
         parent,
@@ -50,13 +64,135 @@ class WhatIfPanel(ctk.CTkFrame):
         self.num_constraints = 0
         self.variable_names: List[str] = []
         self.constraint_names: List[str] = []
-        self.objective_coeffs: List[float] = []
-        self.constraint_matrix: np.ndarray = None
-        self.rhs_values: List[float] = []
-        self.solution: Dict[str, Any] = {}
+        # Objective and RHS storage: over-allocated buffers and their used lengths
+        self._vector_bufs: Dict[str, np.ndarray] = {'objective': np.zeros(0), 'rhs': np.zeros(0)}
+        self._vector_lens: Dict[str, int] = {'objective': 0, 'rhs': 0}
+        # Constraint matrix storage: an over-allocated buffer and its used shape
+        self._matrix_buf: Optional[np.ndarray] = None
+        self._matrix_shape = (0, 0)
+        self.solution: Optional[LPResult] = None
+        
+        # Fonts shared by all widgets of the panel, built once
+        self._fonts = {
+            'title': ctk.CTkFont(family=FONTS.get("family", "Segoe UI"), size=18, weight="bold"),
+            'dialog_title': ctk.CTkFont(size=16, weight="bold"),
+            'bold_lg': ctk.CTkFont(size=14, weight="bold"),
+            'bold_section': ctk.CTkFont(size=13, weight="bold"),
+            'bold_md': ctk.CTkFont(size=12, weight="bold"),
+            'bold_sm': ctk.CTkFont(size=11, weight="bold"),
+            'bold': ctk.CTkFont(weight="bold"),
+            'plain_md': ctk.CTkFont(size=12),
+            'plain_sm': ctk.CTkFont(size=11),
+        }
+        
+        # Pooled list rows, reused across refreshes instead of rebuilt
+        self._var_rows: List[Dict[str, Any]] = []
+        self._const_rows: List[Dict[str, Any]] = []
+        self._obj_rows: List[Dict[str, Any]] = []
+        self._rhs_rows: List[Dict[str, Any]] = []
+        
+        # Recently removed variables as (index, name, coefficient, column)
+        self._undo_stack: List[tuple] = []
+        self._undo_toast: Optional[ctk.CTkFrame] = None
+        self._undo_after_id = None
+        
+        # Apply kinds ('objective', 'rhs') waiting for the debounce timer
+        self._pending_apply = set()
+        self._apply_after_id = None
+        
+        # Coefficient edit dialog, built on first use and withdrawn between edits
+        self._edit_dialog: Optional[Dict[str, Any]] = None
         
         self._create_widgets()
     
+    @property
+    def objective_coeffs(self) -> np.ndarray:
+        """The objective coefficients, as a view of the used part of the buffer"""
+        return self._vector_bufs['objective'][:self._vector_lens['objective']]
+    
+    @objective_coeffs.setter
+    def objective_coeffs(self, values: np.ndarray):
+        self._set_vector('objective', values)
+    
+    @property
+    def rhs_values(self) -> np.ndarray:
+        """The RHS values, as a view of the used part of the buffer"""
+        return self._vector_bufs['rhs'][:self._vector_lens['rhs']]
+    
+    @rhs_values.setter
+    def rhs_values(self, values: np.ndarray):
+        self._set_vector('rhs', values)
+    
+    def _set_vector(self, key: str, values: np.ndarray):
+        """Replace a buffered vector ('objective' or 'rhs') with a copy of values"""
+        self._vector_bufs[key] = np.array(values, dtype=np.float64, ndmin=1)
+        self._vector_lens[key] = len(self._vector_bufs[key])
+    
+    def _insert_value(self, key: str, index: int, value: float = 0.0):
+        """Insert value at index of a buffered vector, doubling capacity when full"""
+        length = self._vector_lens[key]
+        buf = self._vector_bufs[key]
+        if length == len(buf):
+            buf = np.empty(max(2 * len(buf), 1))
+            buf[:length] = self._vector_bufs[key][:length]
+            self._vector_bufs[key] = buf
+        
+        buf[index + 1:length + 1] = buf[index:length]
+        buf[index] = value
+        self._vector_lens[key] = length + 1
+    
+    def _delete_value(self, key: str, index: int):
+        """Remove the value at index of a buffered vector by shifting the rest down in place"""
+        length = self._vector_lens[key]
+        buf = self._vector_bufs[key]
+        buf[index:length - 1] = buf[index + 1:length]
+        self._vector_lens[key] = length - 1
+    
+    @property
+    def constraint_matrix(self) -> Optional[np.ndarray]:
+        """The constraint matrix, as a view of the used part of the buffer"""
+        if self._matrix_buf is None:
+            return None
+        rows, cols = self._matrix_shape
+        return self._matrix_buf[:rows, :cols]
+    
+    @constraint_matrix.setter
+    def constraint_matrix(self, matrix: Optional[np.ndarray]):
+        if matrix is None:
+            self._matrix_buf = None
+            self._matrix_shape = (0, 0)
+        else:
+            self._matrix_buf = np.array(matrix, dtype=float, ndmin=2)
+            self._matrix_shape = self._matrix_buf.shape
+    
+    def _grow_matrix(self, axis: int):
+        """Make room for one more row (axis 0) or column (axis 1), doubling capacity when full"""
+        rows, cols = self._matrix_shape
+        capacity = list(self._matrix_buf.shape)
+        if self._matrix_shape[axis] == capacity[axis]:
+            capacity[axis] = max(2 * capacity[axis], 1)
+            buf = np.empty(capacity)
+            buf[:rows, :cols] = self._matrix_buf[:rows, :cols]
+            self._matrix_buf = buf
+        
+        # Zero only the new row/column
+        if axis == 0:
+            self._matrix_buf[rows, :cols] = 0.0
+            self._matrix_shape = (rows + 1, cols)
+        else:
+            self._matrix_buf[:rows, cols] = 0.0
+            self._matrix_shape = (rows, cols + 1)
+    
+    def _shrink_matrix(self, axis: int, index: int):
+        """Remove a row (axis 0) or column (axis 1) by shifting the rest down in place"""
+        rows, cols = self._matrix_shape
+        if axis == 0:
+            self._matrix_buf[index:rows - 1, :cols] = self._matrix_buf[index + 1:rows, :cols]
+            self._matrix_shape = (rows - 1, cols)
+        else:
+            self._matrix_buf[:rows, index:cols - 1] = self._matrix_buf[:rows, index + 1:cols]
+            self._matrix_shape = (rows, cols - 1)
+    
     def _create_widgets(self):
         """Create the panel widgets"""
         # Title
@@ -66,7 +202,7 @@ class WhatIfPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             title_frame,
             text="🔬 What-If Analysis",
-            font=ctk.CTkFont(family=FONTS.get("family", "Segoe UI"), size=18, weight="bold"),
+            font=self._fonts['title'],
             text_color=COLORS.get("text_primary", "#1E293B")
         ).pack(side="left")
         
@@ -76,7 +212,7 @@ class WhatIfPanel(ctk.CTkFrame):
             text="⟳ Re-Solve",
             width=100,
             height=32,
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self._fonts['bold_md'],
             fg_color=COLORS.get("success", "#00C853"),
             hover_color="#00A040",
             command=self._on_resolve
@@ -84,7 +220,7 @@ class WhatIfPanel(ctk.CTkFrame):
         self.resolve_btn.pack(side="right")
         
         # Tabview for different analysis types
-        self.tabview = ctk.CTkTabview(self, height=500)
+        self.tabview = ctk.CTkTabview(self, height=500, command=self._on_tab_changed)
         self.tabview.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Create tabs
@@ -94,12 +230,35 @@ class WhatIfPanel(ctk.CTkFrame):
         self.tabview.add("RHS Values")
         self.tabview.add("Ranges")
         
-        # Setup each tab
-        self._setup_variables_tab()
-        self._setup_constraints_tab()
-        self._setup_objective_tab()
-        self._setup_rhs_tab()
-        self._setup_ranges_tab()
+        # Tab contents are built the first time each tab is shown
+        self._tab_builders = {
+            "Variables": (self._setup_variables_tab, self._refresh_variables_display),
+            "Constraints": (self._setup_constraints_tab, self._refresh_constraints_display),
+            "Objective": (self._setup_objective_tab, self._refresh_objective_display),
+            "RHS Values": (self._setup_rhs_tab, self._refresh_rhs_display),
+            "Ranges": (self._setup_ranges_tab, self._refresh_ranges_display),
+        }
+        self._built_tabs = set()
+        self._build_tab(self.tabview.get())
+    
+    def _on_tab_changed(self):
+        """Build the newly selected tab if it has not been shown before"""
+        self._build_tab(self.tabview.get())
+    
+    def _build_tab(self, name: str):
+        """Create a tab's widgets and fill them with the current problem"""
+        if name in self._built_tabs:
+            return
+        setup, refresh = self._tab_builders[name]
+        setup()
+        self._built_tabs.add(name)
+        refresh()
+    
+    def _refresh_tabs(self, *names: str):
+        """Refresh the given tabs; tabs not built yet are filled when first shown"""
+        for name in names:
+            if name in self._built_tabs:
+                self._tab_builders[name][1]()
     
     def _setup_variables_tab(self):
         """Setup the variables management tab"""
@@ -112,7 +271,7 @@ class WhatIfPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             header,
             text="Decision Variables",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._fonts['bold_lg']
         ).pack(side="left")
         
         ctk.CTkButton(
@@ -125,14 +284,17 @@ class WhatIfPanel(ctk.CTkFrame):
         ).pack(side="right")
         
         # Variables list frame
-        self.variables_frame = ctk.CTkScrollableFrame(tab, height=350)
-        self.variables_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        self._var_list = self._create_list_window(
+            tab, self._var_rows, self._create_variable_row, self._update_variable_row, "x",
+            "No variables defined. Add variables to begin."
+        )
+        self.variables_frame = self._var_list['canvas']
         
         # Variable count label
         self.var_count_label = ctk.CTkLabel(
             tab,
             text="Total: 0 variables",
-            font=ctk.CTkFont(size=11),
+            font=self._fonts['plain_sm'],
             text_color=COLORS.get("text_secondary", "#64748B")
         )
         self.var_count_label.pack(pady=5)
@@ -148,7 +310,7 @@ class WhatIfPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             header,
             text="Constraints",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._fonts['bold_lg']
         ).pack(side="left")
         
         ctk.CTkButton(
@@ -161,14 +323,17 @@ class WhatIfPanel(ctk.CTkFrame):
         ).pack(side="right")
         
         # Constraints list frame
-        self.constraints_frame = ctk.CTkScrollableFrame(tab, height=350)
-        self.constraints_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        self._const_list = self._create_list_window(
+            tab, self._const_rows, self._create_constraint_row, self._update_constraint_row, "C",
+            "No constraints defined. Add constraints to begin."
+        )
+        self.constraints_frame = self._const_list['canvas']
         
         # Constraint count label
         self.const_count_label = ctk.CTkLabel(
             tab,
             text="Total: 0 constraints",
-            font=ctk.CTkFont(size=11),
+            font=self._fonts['plain_sm'],
             text_color=COLORS.get("text_secondary", "#64748B")
         )
         self.const_count_label.pack(pady=5)
@@ -184,7 +349,7 @@ class WhatIfPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             header,
             text="Objective Function Coefficients",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._fonts['bold_lg']
         ).pack(side="left")
         
         ctk.CTkButton(
@@ -200,7 +365,7 @@ class WhatIfPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             tab,
             text="Modify coefficients to see how changes affect the optimal solution",
-            font=ctk.CTkFont(size=11),
+            font=self._fonts['plain_sm'],
             text_color=COLORS.get("text_secondary", "#64748B")
         ).pack(padx=10, anchor="w")
         
@@ -219,7 +384,7 @@ class WhatIfPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             header,
             text="Right-Hand Side Values",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._fonts['bold_lg']
         ).pack(side="left")
         
         ctk.CTkButton(
@@ -235,7 +400,7 @@ class WhatIfPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             tab,
             text="Modify resource availability to analyze impact on optimal solution",
-            font=ctk.CTkFont(size=11),
+            font=self._fonts['plain_sm'],
             text_color=COLORS.get("text_secondary", "#64748B")
         ).pack(padx=10, anchor="w")
         
@@ -251,13 +416,13 @@ class WhatIfPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             tab,
             text="Sensitivity Ranges",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._fonts['bold_lg']
         ).pack(padx=10, pady=10, anchor="w")
         
         ctk.CTkLabel(
             tab,
             text="Shows allowable changes before the optimal basis changes",
-            font=ctk.CTkFont(size=11),
+            font=self._fonts['plain_sm'],
             text_color=COLORS.get("text_secondary", "#64748B")
         ).pack(padx=10, anchor="w")
         
@@ -274,288 +439,497 @@ class WhatIfPanel(ctk.CTkFrame):
         objective_coeffs: List[float],
         constraint_matrix: np.ndarray,
         rhs_values: List[float],
-        solution: Dict[str, Any] = None
+        solution: Optional[LPResult] = None
     ):
         """Load a problem into the what-if panel"""
         self.num_variables = num_variables
         self.num_constraints = num_constraints
         self.variable_names = variable_names.copy()
         self.constraint_names = constraint_names.copy()
-        self.objective_coeffs = list(objective_coeffs)
-        self.constraint_matrix = constraint_matrix.copy() if constraint_matrix is not None else None
-        self.rhs_values = list(rhs_values)
-        self.solution = solution or {}
+        self.objective_coeffs = objective_coeffs
+        self.constraint_matrix = constraint_matrix
+        self.rhs_values = rhs_values
+        self.solution = solution
+        
+        # Undo records refer to the previous problem
+        self._hide_undo_toast()
         
         # Refresh all displays
-        self._refresh_variables_display()
-        self._refresh_constraints_display()
-        self._refresh_objective_display()
-        self._refresh_rhs_display()
-        self._refresh_ranges_display()
+        self._refresh_tabs("Variables", "Constraints", "Objective", "RHS Values", "Ranges")
     
     def _refresh_variables_display(self):
         """Refresh the variables list display"""
-        # Clear existing
-        for widget in self.variables_frame.winfo_children():
-            widget.destroy()
-        
-        if not self.variable_names:
-            ctk.CTkLabel(
-                self.variables_frame,
-                text="No variables defined. Add variables to begin.",
-                text_color=COLORS.get("text_secondary", "#64748B")
-            ).pack(pady=20)
-            self.var_count_label.configure(text="Total: 0 variables")
-            return
-        
-        # Create variable rows
-        for i, name in enumerate(self.variable_names):
-            self._create_variable_row(i, name)
-        
-        self.var_count_label.configure(text=f"Total: {len(self.variable_names)} variables")
+        count = len(self.variable_names)
+        self._refresh_list_window(self._var_list, count)
+        self.var_count_label.configure(text=f"Total: {count} variables")
     
-    def _create_variable_row(self, index: int, name: str):
-        """Create a single variable row"""
-        row = ctk.CTkFrame(self.variables_frame, fg_color=COLORS.get("background", "#F8FAFC"))
-        row.pack(fill="x", pady=3, padx=5)
+    def _create_variable_row(self, index: int) -> Dict[str, Any]:
+        """Create the widgets of a pooled variable row"""
+        row = {'index': index, 'value': None}
+        row['frame'] = ctk.CTkFrame(self.variables_frame, fg_color=COLORS.get("background", "#F8FAFC"))
         
         # Variable index
-        ctk.CTkLabel(
-            row,
+        row['index_label'] = ctk.CTkLabel(
+            row['frame'],
             text=f"x{index + 1}",
             width=40,
-            font=ctk.CTkFont(weight="bold"),
+            font=self._fonts['bold'],
             text_color=COLORS.get("primary", "#0F4C75")
-        ).pack(side="left", padx=10, pady=8)
+        )
+        row['index_label'].pack(side="left", padx=10, pady=8)
         
         # Variable name (editable)
-        name_entry = ctk.CTkEntry(row, width=140, height=30)
-        name_entry.insert(0, name)
-        name_entry.pack(side="left", padx=5)
+        row['name_entry'] = ctk.CTkEntry(row['frame'], width=140, height=30)
+        row['name_entry'].pack(side="left", padx=5)
         
-        # Current value (if solution exists)
-        if self.solution and 'solution' in self.solution:
-            sol = self.solution['solution']
-            if index < len(sol):
-                val = sol[index]
-                ctk.CTkLabel(
-                    row,
-                    text=f"= {val:.4f}",
-                    font=ctk.CTkFont(size=12),
-                    text_color=COLORS.get("success", "#00C853") if val > 0 else COLORS.get("text_secondary", "#64748B")
-                ).pack(side="left", padx=5)
+        # Current value, packed only while a solution value exists
+        row['value_label'] = ctk.CTkLabel(row['frame'], text="", font=self._fonts['plain_md'])
         
         # Edit column coefficients button
         ctk.CTkButton(
-            row,
+            row['frame'],
             text="✏️",
             width=30,
             height=30,
             fg_color=COLORS.get("secondary", "#00A8CC"),
             hover_color="#008AAA",
-            command=lambda idx=index: self._edit_variable_coefficients(idx)
+            command=lambda r=row: self._edit_variable_coefficients(r['index'])
         ).pack(side="right", padx=5)
         
         # Delete button
         ctk.CTkButton(
-            row,
+            row['frame'],
             text="✕",
             width=30,
             height=30,
             fg_color=COLORS.get("error", "#FF1744"),
             hover_color="#CC1133",
-            command=lambda idx=index: self._remove_variable(idx)
+            command=lambda r=row: self._remove_variable(r['index'])
         ).pack(side="right", padx=5)
+        
+        return row
+    
+    def _update_variable_row(self, row: Dict[str, Any]):
+        """Fill a pooled variable row with the name and solution value of its index"""
+        name = self.variable_names[row['index']]
+        if row['name_entry'].get() != name:
+            self._set_entry_text(row['name_entry'], name)
+        
+        # Current value (if solution exists)
+        val = None
+        if self.solution is not None and self.solution.solution is not None:
+            sol = self.solution.solution
+            if row['index'] < len(sol):
+                val = sol[row['index']]
+        
+        if val != row['value']:
+            if val is None:
+                row['value_label'].pack_forget()
+            else:
+                row['value_label'].configure(
+                    text=f"= {val:.4f}",
+                    text_color=COLORS.get("success", "#00C853") if val > 0 else COLORS.get("text_secondary", "#64748B")
+                )
+                if row['value'] is None:
+                    row['value_label'].pack(side="left", padx=5, after=row['name_entry'])
+            row['value'] = val
     
     def _refresh_constraints_display(self):
         """Refresh the constraints list display"""
-        # Clear existing
-        for widget in self.constraints_frame.winfo_children():
-            widget.destroy()
-        
-        if not self.constraint_names:
-            ctk.CTkLabel(
-                self.constraints_frame,
-                text="No constraints defined. Add constraints to begin.",
-                text_color=COLORS.get("text_secondary", "#64748B")
-            ).pack(pady=20)
-            self.const_count_label.configure(text="Total: 0 constraints")
-            return
-        
-        # Create constraint rows
-        for i, name in enumerate(self.constraint_names):
-            self._create_constraint_row(i, name)
-        
-        self.const_count_label.configure(text=f"Total: {len(self.constraint_names)} constraints")
+        count = len(self.constraint_names)
+        self._refresh_list_window(self._const_list, count)
+        self.const_count_label.configure(text=f"Total: {count} constraints")
     
-    def _create_constraint_row(self, index: int, name: str):
-        """Create a single constraint row"""
-        row = ctk.CTkFrame(self.constraints_frame, fg_color=COLORS.get("background", "#F8FAFC"))
-        row.pack(fill="x", pady=3, padx=5)
+    def _create_constraint_row(self, index: int) -> Dict[str, Any]:
+        """Create the widgets of a pooled constraint row"""
+        row = {'index': index, 'status': None}
+        row['frame'] = ctk.CTkFrame(self.constraints_frame, fg_color=COLORS.get("background", "#F8FAFC"))
         
         # Constraint index
-        ctk.CTkLabel(
-            row,
+        row['index_label'] = ctk.CTkLabel(
+            row['frame'],
             text=f"C{index + 1}",
             width=40,
-            font=ctk.CTkFont(weight="bold"),
+            font=self._fonts['bold'],
             text_color=COLORS.get("secondary", "#00A8CC")
-        ).pack(side="left", padx=10, pady=8)
+        )
+        row['index_label'].pack(side="left", padx=10, pady=8)
         
         # Constraint name (editable)
-        name_entry = ctk.CTkEntry(row, width=140, height=30)
-        name_entry.insert(0, name)
-        name_entry.pack(side="left", padx=5)
+        row['name_entry'] = ctk.CTkEntry(row['frame'], width=140, height=30)
+        row['name_entry'].pack(side="left", padx=5)
         
-        # Binding status (if solution exists)
-        if self.solution and 'slack_values' in self.solution:
-            slacks = self.solution['slack_values']
-            if index < len(slacks):
-                slack = slacks[index]
-                status = "Binding" if abs(slack) < 1e-6 else "Non-binding"
-                status_color = COLORS.get("accent", "#FF6B35") if status == "Binding" else COLORS.get("text_secondary", "#64748B")
-                ctk.CTkLabel(
-                    row,
-                    text=f"[{status}]",
-                    font=ctk.CTkFont(size=11),
-                    text_color=status_color
-                ).pack(side="left", padx=5)
+        # Binding status, packed only while slack values exist
+        row['status_label'] = ctk.CTkLabel(row['frame'], text="", font=self._fonts['plain_sm'])
         
         # Edit coefficients button
         ctk.CTkButton(
-            row,
+            row['frame'],
             text="✏️",
             width=30,
             height=30,
             fg_color=COLORS.get("primary", "#0F4C75"),
             hover_color=COLORS.get("primary_dark", "#0A3655"),
-            command=lambda idx=index: self._edit_constraint_coefficients(idx)
+            command=lambda r=row: self._edit_constraint_coefficients(r['index'])
         ).pack(side="right", padx=5)
         
         # Delete button
         ctk.CTkButton(
-            row,
+            row['frame'],
             text="✕",
             width=30,
             height=30,
             fg_color=COLORS.get("error", "#FF1744"),
             hover_color="#CC1133",
-            command=lambda idx=index: self._remove_constraint(idx)
+            command=lambda r=row: self._remove_constraint(r['index'])
         ).pack(side="right", padx=10)
+        
+        return row
     
-    def _refresh_objective_display(self):
-        """Refresh the objective coefficients display"""
-        # Clear existing
-        for widget in self.objective_frame.winfo_children():
-            widget.destroy()
+    def _update_constraint_row(self, row: Dict[str, Any]):
+        """Fill a pooled constraint row with the name and binding status of its index"""
+        name = self.constraint_names[row['index']]
+        if row['name_entry'].get() != name:
+            self._set_entry_text(row['name_entry'], name)
         
-        if not self.variable_names:
-            ctk.CTkLabel(
-                self.objective_frame,
-                text="No variables defined.",
-                text_color=COLORS.get("text_secondary", "#64748B")
-            ).pack(pady=20)
+        # Binding status (if solution exists)
+        status = None
+        if self.solution is not None:
+            slacks = self.solution.slack_values
+            if row['index'] < len(slacks):
+                status = "Binding" if abs(slacks[row['index']]) < 1e-6 else "Non-binding"
+        
+        if status != row['status']:
+            if status is None:
+                row['status_label'].pack_forget()
+            else:
+                status_color = COLORS.get("accent", "#FF6B35") if status == "Binding" else COLORS.get("text_secondary", "#64748B")
+                row['status_label'].configure(text=f"[{status}]", text_color=status_color)
+                if row['status'] is None:
+                    row['status_label'].pack(side="left", padx=5, after=row['name_entry'])
+            row['status'] = status
+    
+    @staticmethod
+    def _padded_values(values: np.ndarray, n: int) -> np.ndarray:
+        """Return the first n values, zero-filled if there are fewer"""
+        padded = np.zeros(n)
+        count = min(n, len(values))
+        padded[:count] = values[:count]
+        return padded
+    
+    @staticmethod
+    def _parse_entries(entries: List[ctk.CTkEntry]) -> np.ndarray:
+        """Parse entry texts into a float array, with NaN for unparsable entries"""
+        def parse(text: str) -> float:
+            try:
+                return float(text)
+            except ValueError:
+                return np.nan
+        
+        return np.fromiter((parse(e.get()) for e in entries), dtype=np.float64, count=len(entries))
+    
+    @classmethod
+    def _store_parsed(cls, target: np.ndarray, entries: List[ctk.CTkEntry]):
+        """Write the parsed entry values into target, leaving unparsable positions unchanged"""
+        values = cls._parse_entries(entries)[:len(target)]
+        valid = ~np.isnan(values)
+        target[:len(values)][valid] = values[valid]
+    
+    def _create_list_window(self, parent, rows: List[Dict[str, Any]], create_row: Callable,
+                            update_row: Callable, prefix: str, empty_text: str) -> Dict[str, Any]:
+        """
+        Set up windowed rendering for a pooled list on a scrolling canvas
+        
+        At most LIST_WINDOW rows exist as widgets. Each sits on the canvas
+        at the position of the list item it shows and the scroll region
+        spans the whole list, so the scrollbar still reflects every item
+        while the rows are moved to follow the visible range.
+        """
+        container = ctk.CTkFrame(parent, fg_color="transparent")
+        container.pack(fill="both", expand=True, padx=10, pady=5)
+        
+        pitch = self._apply_widget_scaling(self.LIST_ROW_HEIGHT + self.LIST_ROW_GAP)
+        canvas = tk.Canvas(
+            container,
+            height=self._apply_widget_scaling(350),
+            highlightthickness=0,
+            borderwidth=0,
+            yscrollincrement=pitch
+        )
+        scrollbar = ctk.CTkScrollbar(container, command=canvas.yview)
+        scrollbar.pack(side="right", fill="y")
+        canvas.pack(side="left", fill="both", expand=True)
+        
+        state = {
+            'rows': rows, 'create_row': create_row, 'update_row': update_row, 'prefix': prefix,
+            'canvas': canvas, 'scrollbar': scrollbar, 'count': 0, 'start': 0, 'pitch': pitch,
+            'wheel_tag': f"WhatIfList{id(canvas)}", 'follow_id': None
+        }
+        state['empty'] = canvas.create_text(
+            0, self._apply_widget_scaling(20),
+            anchor="n",
+            text=empty_text,
+            fill=COLORS.get("text_secondary", "#64748B"),
+            state="hidden"
+        )
+        
+        canvas.configure(yscrollcommand=lambda first, last: self._on_list_scroll(state, first, last))
+        canvas.bind("<Configure>", lambda event: self._on_list_resize(state, event.width))
+        
+        # Wheel scrolling over the canvas or any row, without touching global bindings
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind_class(state['wheel_tag'], sequence, lambda event: self._on_list_wheel(state, event))
+        self._add_bindtag(canvas, state['wheel_tag'])
+        
+        self._apply_list_colors(state)
+        return state
+    
+    def _apply_list_colors(self, state: Dict[str, Any]):
+        """Give a list canvas the background of the tab it sits on"""
+        state['canvas'].configure(bg=self._apply_appearance_mode(self.tabview.cget("fg_color")))
+    
+    def _set_appearance_mode(self, mode_string: str):
+        """Re-colour the list canvases when the appearance mode changes"""
+        super()._set_appearance_mode(mode_string)
+        for attr in ('_var_list', '_const_list'):
+            state = getattr(self, attr, None)
+            if state is not None:
+                self._apply_list_colors(state)
+    
+    @classmethod
+    def _add_bindtag(cls, widget, tag: str):
+        """Put tag first in the bindtags of a widget and all of its descendants"""
+        widget.bindtags((tag,) + widget.bindtags())
+        for child in widget.winfo_children():
+            cls._add_bindtag(child, tag)
+    
+    def _on_list_wheel(self, state: Dict[str, Any], event):
+        """Scroll a list canvas by one row per wheel step"""
+        if event.num == 4:
+            amount = -1
+        elif event.num == 5:
+            amount = 1
+        elif abs(event.delta) < 120:
+            # Trackpads send small deltas
+            amount = -1 if event.delta > 0 else 1
+        else:
+            amount = int(-1 * (event.delta / 120))
+        state['canvas'].yview_scroll(amount, "units")
+        return "break"
+    
+    def _on_list_resize(self, state: Dict[str, Any], width: int):
+        """Stretch the rows of a list across the canvas width"""
+        pad = self._apply_widget_scaling(5)
+        canvas = state['canvas']
+        canvas.coords(state['empty'], width / 2, self._apply_widget_scaling(20))
+        for row in state['rows']:
+            canvas.itemconfigure(row['window'], width=max(1, width - 2 * pad))
+    
+    def _refresh_list_window(self, state: Dict[str, Any], count: int):
+        """Re-fill a windowed list after its length or contents changed"""
+        rows, canvas = state['rows'], state['canvas']
+        window = min(count, self.LIST_WINDOW)
+        while len(rows) < window:
+            row = state['create_row'](len(rows))
+            row['window'] = canvas.create_window(
+                0, 0,
+                window=row['frame'],
+                anchor="nw",
+                width=max(1, canvas.winfo_width() - 2 * self._apply_widget_scaling(5)),
+                height=self._apply_widget_scaling(self.LIST_ROW_HEIGHT),
+                state="hidden"
+            )
+            self._add_bindtag(row['frame'], state['wheel_tag'])
+            rows.append(row)
+        for row in rows[window:]:
+            canvas.itemconfigure(row['window'], state="hidden")
+        
+        canvas.itemconfigure(state['empty'], state="normal" if count == 0 else "hidden")
+        canvas.configure(scrollregion=(0, 0, 0, count * state['pitch']))
+        state['count'] = count
+        self._render_list_window(state, max(0, min(state['start'], count - window)))
+    
+    def _render_list_window(self, state: Dict[str, Any], start: int):
+        """Show list items start .. start + LIST_WINDOW in the pooled rows"""
+        canvas = state['canvas']
+        window = min(state['count'], self.LIST_WINDOW)
+        pad = self._apply_widget_scaling(5)
+        
+        for k in range(window):
+            row = state['rows'][k]
+            canvas.coords(row['window'], pad, (start + k) * state['pitch'])
+            canvas.itemconfigure(row['window'], state="normal")
+            if row['index'] != start + k:
+                row['index'] = start + k
+                row['index_label'].configure(text=f"{state['prefix']}{start + k + 1}")
+            state['update_row'](row)
+        state['start'] = start
+    
+    def _on_list_scroll(self, state: Dict[str, Any], first: str, last: str):
+        """Update a list's scrollbar and follow the view once the scroll settles"""
+        state['scrollbar'].set(first, last)
+        if state['follow_id'] is None:
+            state['follow_id'] = self.after_idle(self._follow_list_scroll, state)
+    
+    def _follow_list_scroll(self, state: Dict[str, Any]):
+        """Move a list's window when the visible range leaves it"""
+        state['follow_id'] = None
+        canvas = state['canvas']
+        if not canvas.winfo_exists():
             return
         
-        self.obj_entries = []
+        count = state['count']
+        window = min(count, self.LIST_WINDOW)
+        if count <= window:
+            return
         
-        # Create header
-        header = ctk.CTkFrame(self.objective_frame, fg_color="transparent")
-        header.pack(fill="x", padx=5, pady=5)
+        first, last = canvas.yview()
+        visible_first = int(first * count)
+        visible_last = min(count, int(last * count) + 1)
+        if state['start'] <= visible_first and visible_last <= state['start'] + window:
+            return
         
-        ctk.CTkLabel(header, text="Variable", width=100, font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
-        ctk.CTkLabel(header, text="Coefficient", width=100, font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
-        ctk.CTkLabel(header, text="New Value", width=100, font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
+        # Centre the window on the visible range
+        start = visible_first - (window - (visible_last - visible_first)) // 2
+        self._render_list_window(state, max(0, min(start, count - window)))
+    
+    @staticmethod
+    def _set_entry_text(entry: ctk.CTkEntry, text: str):
+        """Replace the text of an entry"""
+        entry.delete(0, "end")
+        entry.insert(0, text)
+    
+    @staticmethod
+    def _show_row(row: Dict[str, Any], **pack_options):
+        """Pack a pooled row if it is currently hidden"""
+        if not row['visible']:
+            row['frame'].pack(fill="x", **pack_options)
+            row['visible'] = True
+    
+    @staticmethod
+    def _hide_surplus_rows(rows: List[Dict[str, Any]], count: int):
+        """Unpack pooled rows past count, keeping them for later reuse"""
+        for row in rows[count:]:
+            if row['visible']:
+                row['frame'].pack_forget()
+                row['visible'] = False
+    
+    def _set_empty_label(self, parent, attr: str, text: str, show: bool):
+        """Show or hide the placeholder label of an empty list"""
+        label = getattr(self, attr, None)
+        if show:
+            if label is None:
+                label = ctk.CTkLabel(parent, text=text, text_color=COLORS.get("text_secondary", "#64748B"))
+                setattr(self, attr, label)
+            label.pack(pady=20)
+        elif label is not None:
+            label.pack_forget()
+    
+    def _refresh_objective_display(self):
+        """Refresh the objective coefficients display"""
+        n = len(self.variable_names)
+        self._set_empty_label(self.objective_frame, "_obj_empty_label", "No variables defined.", n == 0)
+        self._set_table_header(
+            self.objective_frame, "_obj_header",
+            [("Variable", 100), ("Coefficient", 100), ("New Value", 100)], n > 0
+        )
         
-        # Create coefficient rows
-        for i, name in enumerate(self.variable_names):
-            row = ctk.CTkFrame(self.objective_frame, fg_color=COLORS.get("background", "#F8FAFC"))
-            row.pack(fill="x", pady=2, padx=5)
-            
-            ctk.CTkLabel(
-                row,
-                text=name[:15],
-                width=100,
-                anchor="w"
-            ).pack(side="left", padx=10, pady=5)
-            
-            current = self.objective_coeffs[i] if i < len(self.objective_coeffs) else 0
-            ctk.CTkLabel(
-                row,
-                text=f"{current:.2f}",
-                width=100,
-                text_color=COLORS.get("primary", "#0F4C75")
-            ).pack(side="left", padx=5)
+        # Current values and their label texts for all rows at once
+        currents = self._padded_values(self.objective_coeffs, n)
+        current_strs = np.char.mod("%.2f", currents).tolist()
+        
+        # Reuse pooled rows and only reconfigure those whose values changed
+        for i, (name, current) in enumerate(zip(self.variable_names, currents.tolist())):
+            if i == len(self._obj_rows):
+                self._obj_rows.append(self._create_value_row(self.objective_frame, 100, 15))
+            row = self._obj_rows[i]
+            self._show_row(row, pady=2, padx=5)
             
-            entry = ctk.CTkEntry(row, width=100, height=28)
-            entry.insert(0, str(current))
-            entry.pack(side="left", padx=5)
-            self.obj_entries.append(entry)
+            rendered = (name, current)
+            if row['rendered'] != rendered:
+                self._update_value_row(row, name, current, current_strs[i])
+                row['rendered'] = rendered
+        
+        self._hide_surplus_rows(self._obj_rows, n)
+        self.obj_entries = [row['entry'] for row in self._obj_rows[:n]]
     
     def _refresh_rhs_display(self):
         """Refresh the RHS values display"""
-        # Clear existing
-        for widget in self.rhs_frame.winfo_children():
-            widget.destroy()
+        n = len(self.constraint_names)
+        self._set_empty_label(self.rhs_frame, "_rhs_empty_label", "No constraints defined.", n == 0)
+        self._set_table_header(
+            self.rhs_frame, "_rhs_header",
+            [("Constraint", 120), ("Current RHS", 100), ("New Value", 100), ("Shadow Price", 100)], n > 0
+        )
         
-        if not self.constraint_names:
-            ctk.CTkLabel(
-                self.rhs_frame,
-                text="No constraints defined.",
-                text_color=COLORS.get("text_secondary", "#64748B")
-            ).pack(pady=20)
-            return
+        # Current values, shadow prices and their label texts for all rows at once
+        currents = self._padded_values(self.rhs_values, n)
+        current_strs = np.char.mod("%.2f", currents).tolist()
+        
+        sps = np.zeros(n)
+        if self.solution is not None and len(self.solution.shadow_prices) > 0:
+            sps = self._padded_values(np.asarray(self.solution.shadow_prices, dtype=float), n)
+        sp_strs = np.char.mod("%.4f", sps).tolist()
+        
+        # Reuse pooled rows and only reconfigure those whose values changed
+        for i, (name, current, sp) in enumerate(zip(self.constraint_names, currents.tolist(), sps.tolist())):
+            if i == len(self._rhs_rows):
+                row = self._create_value_row(self.rhs_frame, 120, 18)
+                row['sp_label'] = ctk.CTkLabel(row['frame'], text="", width=100)
+                row['sp_label'].pack(side="left", padx=5)
+                self._rhs_rows.append(row)
+            row = self._rhs_rows[i]
+            self._show_row(row, pady=2, padx=5)
+            
+            rendered = (name, current, sp)
+            if row['rendered'] != rendered:
+                self._update_value_row(row, name, current, current_strs[i])
+                sp_color = COLORS.get("success", "#00C853") if sp > 0 else COLORS.get("text_secondary", "#64748B")
+                row['sp_label'].configure(text=sp_strs[i], text_color=sp_color)
+                row['rendered'] = rendered
+        
+        self._hide_surplus_rows(self._rhs_rows, n)
+        self.rhs_entries = [row['entry'] for row in self._rhs_rows[:n]]
+    
+    def _create_value_row(self, parent, name_width: int, name_chars: int) -> Dict[str, Any]:
+        """Create a pooled name / current value / new value row"""
+        row = {'visible': False, 'rendered': None, 'name_chars': name_chars}
+        row['frame'] = ctk.CTkFrame(parent, fg_color=COLORS.get("background", "#F8FAFC"))
         
-        self.rhs_entries = []
+        row['name_label'] = ctk.CTkLabel(row['frame'], text="", width=name_width, anchor="w")
+        row['name_label'].pack(side="left", padx=10, pady=5)
         
-        # Create header
-        header = ctk.CTkFrame(self.rhs_frame, fg_color="transparent")
-        header.pack(fill="x", padx=5, pady=5)
-        
-        ctk.CTkLabel(header, text="Constraint", width=120, font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
-        ctk.CTkLabel(header, text="Current RHS", width=100, font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
-        ctk.CTkLabel(header, text="New Value", width=100, font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
-        ctk.CTkLabel(header, text="Shadow Price", width=100, font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
-        
-        # Create RHS rows
-        for i, name in enumerate(self.constraint_names):
-            row = ctk.CTkFrame(self.rhs_frame, fg_color=COLORS.get("background", "#F8FAFC"))
-            row.pack(fill="x", pady=2, padx=5)
-            
-            ctk.CTkLabel(
-                row,
-                text=name[:18],
-                width=120,
-                anchor="w"
-            ).pack(side="left", padx=10, pady=5)
-            
-            current = self.rhs_values[i] if i < len(self.rhs_values) else 0
-            ctk.CTkLabel(
-                row,
-                text=f"{current:.2f}",
-                width=100,
-                text_color=COLORS.get("primary", "#0F4C75")
-            ).pack(side="left", padx=5)
-            
-            entry = ctk.CTkEntry(row, width=100, height=28)
-            entry.insert(0, str(current))
-            entry.pack(side="left", padx=5)
-            self.rhs_entries.append(entry)
-            
-            # Shadow price
-            sp = 0
-            if self.solution and 'shadow_prices' in self.solution:
-                sps = self.solution['shadow_prices']
-                if i < len(sps):
-                    sp = sps[i]
-            
-            sp_color = COLORS.get("success", "#00C853") if sp > 0 else COLORS.get("text_secondary", "#64748B")
-            ctk.CTkLabel(
-                row,
-                text=f"{sp:.4f}",
-                width=100,
-                text_color=sp_color
-            ).pack(side="left", padx=5)
+        row['current_label'] = ctk.CTkLabel(
+            row['frame'],
+            text="",
+            width=100,
+            text_color=COLORS.get("primary", "#0F4C75")
+        )
+        row['current_label'].pack(side="left", padx=5)
+        
+        row['entry'] = ctk.CTkEntry(row['frame'], width=100, height=28)
+        row['entry'].pack(side="left", padx=5)
+        
+        return row
+    
+    def _update_value_row(self, row: Dict[str, Any], name: str, current: float, current_str: str):
+        """Show a name and current value in a pooled value row and reset its entry"""
+        row['name_label'].configure(text=name[:row['name_chars']])
+        row['current_label'].configure(text=current_str)
+        self._set_entry_text(row['entry'], str(current))
+    
+    def _set_table_header(self, parent, attr: str, columns: List[tuple], show: bool):
+        """Show or hide the persistent header row of a table"""
+        header = getattr(self, attr, None)
+        if show:
+            if header is None:
+                header = ctk.CTkFrame(parent, fg_color="transparent")
+                for text, width in columns:
+                    ctk.CTkLabel(header, text=text, width=width, font=self._fonts['bold']).pack(side="left", padx=5)
+                setattr(self, attr, header)
+            header.pack(fill="x", padx=5, pady=5)
+        elif header is not None:
+            header.pack_forget()
     
     def _refresh_ranges_display(self):
         """Refresh the sensitivity ranges display"""
@@ -563,7 +937,7 @@ class WhatIfPanel(ctk.CTkFrame):
         for widget in self.ranges_frame.winfo_children():
             widget.destroy()
         
-        if not self.solution:
+        if self.solution is None:
             ctk.CTkLabel(
                 self.ranges_frame,
                 text="Solve the problem first to see sensitivity ranges.",
@@ -572,18 +946,18 @@ class WhatIfPanel(ctk.CTkFrame):
             return
         
         # Objective coefficient ranges section
-        if 'objective_ranges' in self.solution:
+        if self.solution.objective_ranges:
             self._create_ranges_section(
                 "Objective Coefficient Ranges",
-                self.solution['objective_ranges'],
+                self.solution.objective_ranges,
                 is_objective=True
             )
         
         # RHS ranges section
-        if 'rhs_ranges' in self.solution:
+        if self.solution.rhs_ranges:
             self._create_ranges_section(
                 "RHS (Resource) Ranges",
-                self.solution['rhs_ranges'],
+                self.solution.rhs_ranges,
                 is_objective=False
             )
     
@@ -596,41 +970,49 @@ class WhatIfPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             section,
             text=title,
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=self._fonts['bold_section'],
             text_color=COLORS.get("primary", "#0F4C75")
         ).pack(anchor="w", padx=5)
         
-        # Header
-        header = ctk.CTkFrame(section, fg_color=COLORS.get("primary", "#0F4C75"))
-        header.pack(fill="x", padx=5, pady=5)
-        
-        cols = ["Name", "Current", "Allow ↓", "Allow ↑"]
-        for col in cols:
-            ctk.CTkLabel(
-                header,
-                text=col,
-                width=90,
-                font=ctk.CTkFont(size=11, weight="bold"),
-                text_color="white"
-            ).pack(side="left", padx=5, pady=5)
-        
-        # Data rows
-        for r in ranges:
-            row = ctk.CTkFrame(section, fg_color=COLORS.get("background", "#F8FAFC"))
-            row.pack(fill="x", padx=5, pady=1)
-            
-            name = r.get('name', 'N/A')[:12]
-            current = r.get('current_coefficient' if is_objective else 'current_rhs', 0)
-            dec = r.get('allowable_decrease', 0)
-            inc = r.get('allowable_increase', float('inf'))
-            
-            dec_str = f"{dec:.2f}" if dec != float('inf') else "∞"
-            inc_str = f"{inc:.2f}" if inc != float('inf') else "∞"
-            
-            ctk.CTkLabel(row, text=name, width=90, anchor="w").pack(side="left", padx=5, pady=3)
-            ctk.CTkLabel(row, text=f"{current:.2f}", width=90).pack(side="left", padx=5)
-            ctk.CTkLabel(row, text=dec_str, width=90, text_color=COLORS.get("error", "#FF1744")).pack(side="left", padx=5)
-            ctk.CTkLabel(row, text=inc_str, width=90, text_color=COLORS.get("success", "#00C853")).pack(side="left", padx=5)
+        # Format every column at once
+        current_key = 'current_coefficient' if is_objective else 'current_rhs'
+        names = [r.get('name', 'N/A')[:12] for r in ranges]
+        current_strs = self._format_range_column(ranges, current_key, 0.0)
+        dec_strs = self._format_range_column(ranges, 'allowable_decrease', 0.0)
+        inc_strs = self._format_range_column(ranges, 'allowable_increase', float('inf'))
+        
+        # Native table; Tk draws only the visible rows
+        table = ctk.CTkFrame(section, fg_color="transparent")
+        table.pack(fill="x", padx=5, pady=5)
+        
+        tree = ttk.Treeview(
+            table,
+            columns=("current", "dec", "inc"),
+            show="tree headings",
+            height=max(1, min(len(ranges), 15))
+        )
+        tree.heading("#0", text="Name", anchor="w")
+        tree.column("#0", width=110, anchor="w")
+        for col, text in (("current", "Current"), ("dec", "Allow ↓"), ("inc", "Allow ↑")):
+            tree.heading(col, text=text)
+            tree.column(col, width=90, anchor="center")
+        
+        for name, values in zip(names, zip(current_strs, dec_strs, inc_strs)):
+            tree.insert("", "end", text=name, values=values)
+        
+        scrollbar = ttk.Scrollbar(table, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side="left", fill="x", expand=True)
+        scrollbar.pack(side="right", fill="y")
+    
+    @staticmethod
+    def _format_range_column(ranges: List[Dict], key: str, default: float) -> List[str]:
+        """Format one field of the range dicts with two decimals, showing +inf as "∞" """
+        values = np.fromiter((r.get(key, default) for r in ranges), dtype=np.float64, count=len(ranges))
+        infinite = np.isposinf(values)
+        strs = np.char.mod("%.2f", np.where(infinite, 0.0, values)).astype(object)
+        strs[infinite] = "∞"
+        return strs.tolist()
     
     def _add_variable(self):
         """Add a new decision variable"""
@@ -638,16 +1020,14 @@ class WhatIfPanel(ctk.CTkFrame):
         new_name = f"Variable {new_idx}"
         
         self.variable_names.append(new_name)
-        self.objective_coeffs.append(0.0)
+        self._insert_value('objective', len(self.objective_coeffs))
         self.num_variables += 1
         
         # Add column to constraint matrix
-        if self.constraint_matrix is not None:
-            new_col = np.zeros((self.constraint_matrix.shape[0], 1))
-            self.constraint_matrix = np.hstack([self.constraint_matrix, new_col])
+        if self._matrix_buf is not None:
+            self._grow_matrix(axis=1)
         
-        self._refresh_variables_display()
-        self._refresh_objective_display()
+        self._refresh_tabs("Variables", "Objective")
         
         if self.on_variable_change:
             self.on_variable_change('add', new_idx - 1, new_name)
@@ -660,34 +1040,50 @@ class WhatIfPanel(ctk.CTkFrame):
         
         var_name = self.variable_names[variable_index] if variable_index < len(self.variable_names) else f"x{variable_index+1}"
         
-        # Create dialog window
+        matrix = self.constraint_matrix
+        values = matrix[:, variable_index] if variable_index < matrix.shape[1] else np.zeros(0)
+        names = [
+            self.constraint_names[i] if i < len(self.constraint_names) else f"C{i+1}"
+            for i in range(self.num_constraints)
+        ]
+        
+        self._open_edit_dialog(
+            title=f"Edit Variable: {var_name}",
+            heading=f"Edit Coefficients for {var_name}",
+            description="Modify how this variable appears in each constraint:",
+            name_column="Constraint",
+            names=names,
+            values=self._padded_values(values, len(names)),
+            target=('variable', variable_index, var_name)
+        )
+    
+    def _get_edit_dialog(self) -> Dict[str, Any]:
+        """Return the coefficient edit dialog, building it on first use"""
+        if self._edit_dialog is not None:
+            return self._edit_dialog
+        
         dialog = ctk.CTkToplevel(self)
-        dialog.title(f"Edit Variable: {var_name}")
         dialog.geometry("500x400")
         dialog.transient(self.winfo_toplevel())
-        dialog.grab_set()
-        
-        # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() - 500) // 2
-        y = (dialog.winfo_screenheight() - 400) // 2
-        dialog.geometry(f"+{x}+{y}")
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_edit_dialog)
         
         # Title
-        ctk.CTkLabel(
+        heading = ctk.CTkLabel(
             dialog,
-            text=f"Edit Coefficients for {var_name}",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            text="",
+            font=self._fonts['dialog_title'],
             text_color=COLORS.get("primary", "#0F4C75")
-        ).pack(pady=15)
+        )
+        heading.pack(pady=15)
         
         # Description
-        ctk.CTkLabel(
+        description = ctk.CTkLabel(
             dialog,
-            text="Modify how this variable appears in each constraint:",
-            font=ctk.CTkFont(size=11),
+            text="",
+            font=self._fonts['plain_sm'],
             text_color=COLORS.get("text_secondary", "#64748B")
-        ).pack(pady=5)
+        )
+        description.pack(pady=5)
         
         # Scrollable frame for coefficients
         coeff_frame = ctk.CTkScrollableFrame(dialog, height=250)
@@ -696,58 +1092,25 @@ class WhatIfPanel(ctk.CTkFrame):
         # Create header
         header = ctk.CTkFrame(coeff_frame, fg_color="transparent")
         header.pack(fill="x", pady=5)
-        ctk.CTkLabel(header, text="Constraint", width=150, font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
-        ctk.CTkLabel(header, text="Coefficient", width=100, font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
+        name_column = ctk.CTkLabel(header, text="", width=150, font=self._fonts['bold'])
+        name_column.pack(side="left", padx=5)
+        ctk.CTkLabel(header, text="Coefficient", width=100, font=self._fonts['bold']).pack(side="left", padx=5)
         
-        # Store entries
-        coeff_entries = []
-        
-        # Create entry for each constraint
-        for i in range(self.num_constraints):
-            row = ctk.CTkFrame(coeff_frame, fg_color=COLORS.get("background", "#F8FAFC"))
-            row.pack(fill="x", pady=2)
-            
-            const_name = self.constraint_names[i] if i < len(self.constraint_names) else f"C{i+1}"
-            ctk.CTkLabel(
-                row,
-                text=const_name[:20],
-                width=150,
-                anchor="w"
-            ).pack(side="left", padx=10, pady=5)
-            
-            current_val = self.constraint_matrix[i, variable_index] if i < self.constraint_matrix.shape[0] and variable_index < self.constraint_matrix.shape[1] else 0
-            entry = ctk.CTkEntry(row, width=100, height=28)
-            entry.insert(0, str(current_val))
-            entry.pack(side="left", padx=5)
-            coeff_entries.append(entry)
+        # One grid holds every coefficient row, instead of a frame per row
+        grid = ctk.CTkFrame(coeff_frame, fg_color=COLORS.get("background", "#F8FAFC"))
+        grid.pack(fill="x")
         
         # Button frame
         btn_frame = ctk.CTkFrame(dialog, fg_color="transparent")
         btn_frame.pack(fill="x", padx=20, pady=15)
         
-        def apply_changes():
-            """Apply coefficient changes"""
-            for i, entry in enumerate(coeff_entries):
-                try:
-                    val = float(entry.get())
-                    if i < self.constraint_matrix.shape[0] and variable_index < self.constraint_matrix.shape[1]:
-                        self.constraint_matrix[i, variable_index] = val
-                except ValueError:
-                    pass
-            dialog.destroy()
-            messagebox.showinfo("Applied", f"Coefficients for {var_name} updated. Click 'Re-Solve' to see results.")
-        
-        def cancel():
-            """Cancel without saving"""
-            dialog.destroy()
-        
         ctk.CTkButton(
             btn_frame,
             text="Cancel",
             width=100,
             fg_color=COLORS.get("text_secondary", "#64748B"),
             hover_color="#475569",
-            command=cancel
+            command=self._hide_edit_dialog
         ).pack(side="left", padx=10)
         
         ctk.CTkButton(
@@ -756,8 +1119,77 @@ class WhatIfPanel(ctk.CTkFrame):
             width=120,
             fg_color=COLORS.get("success", "#00C853"),
             hover_color="#00A040",
-            command=apply_changes
+            command=self._apply_edit_dialog
         ).pack(side="right", padx=10)
+        
+        self._edit_dialog = {
+            'window': dialog, 'heading': heading, 'description': description,
+            'name_column': name_column, 'grid': grid, 'rows': [], 'target': None
+        }
+        return self._edit_dialog
+    
+    def _open_edit_dialog(self, title: str, heading: str, description: str, name_column: str,
+                          names: List[str], values: np.ndarray, target: tuple):
+        """Fill the cached edit dialog with one coefficient row per name and show it"""
+        dialog = self._get_edit_dialog()
+        window = dialog['window']
+        window.title(title)
+        dialog['heading'].configure(text=heading)
+        dialog['description'].configure(text=description)
+        dialog['name_column'].configure(text=name_column)
+        dialog['target'] = target
+        
+        # Reuse the pooled coefficient rows, creating only the missing ones
+        rows = dialog['rows']
+        while len(rows) < len(names):
+            rows.append({
+                'label': ctk.CTkLabel(dialog['grid'], text="", width=150, anchor="w"),
+                'entry': ctk.CTkEntry(dialog['grid'], width=100, height=28),
+                'visible': False
+            })
+        for row in rows[len(names):]:
+            if row['visible']:
+                row['label'].grid_remove()
+                row['entry'].grid_remove()
+                row['visible'] = False
+        
+        for i, (row, name, value) in enumerate(zip(rows, names, values.tolist())):
+            row['label'].configure(text=name[:20])
+            self._set_entry_text(row['entry'], str(value))
+            if not row['visible']:
+                row['label'].grid(row=i, column=0, sticky="w", padx=10, pady=2)
+                row['entry'].grid(row=i, column=1, padx=5, pady=2)
+                row['visible'] = True
+        
+        window.deiconify()
+        
+        # Center the dialog
+        window.update_idletasks()
+        x = (window.winfo_screenwidth() - 500) // 2
+        y = (window.winfo_screenheight() - 400) // 2
+        window.geometry(f"+{x}+{y}")
+        window.grab_set()
+    
+    def _apply_edit_dialog(self):
+        """Apply coefficient changes from the edit dialog"""
+        dialog = self._edit_dialog
+        kind, index, name = dialog['target']
+        entries = [row['entry'] for row in dialog['rows'] if row['visible']]
+        
+        matrix = self.constraint_matrix
+        if kind == 'variable' and index < matrix.shape[1]:
+            self._store_parsed(matrix[:, index], entries)
+        elif kind == 'constraint' and index < matrix.shape[0]:
+            self._store_parsed(matrix[index], entries)
+        
+        self._hide_edit_dialog()
+        messagebox.showinfo("Applied", f"Coefficients for {name} updated. Click 'Re-Solve' to see results.")
+    
+    def _hide_edit_dialog(self):
+        """Withdraw the edit dialog, keeping it for the next edit"""
+        window = self._edit_dialog['window']
+        window.grab_release()
+        window.withdraw()
 
     def _remove_variable(self, index: int):
         """Remove a decision variable"""
@@ -765,21 +1197,90 @@ class WhatIfPanel(ctk.CTkFrame):
             messagebox.showwarning("Cannot Remove", "Must have at least one variable.")
             return
         
-        if messagebox.askyesno("Confirm Delete", f"Remove variable '{self.variable_names[index]}'?"):
-            del self.variable_names[index]
-            if index < len(self.objective_coeffs):
-                del self.objective_coeffs[index]
-            self.num_variables -= 1
-            
-            # Remove column from constraint matrix
-            if self.constraint_matrix is not None and self.constraint_matrix.shape[1] > index:
-                self.constraint_matrix = np.delete(self.constraint_matrix, index, axis=1)
-            
-            self._refresh_variables_display()
-            self._refresh_objective_display()
-            
-            if self.on_variable_change:
-                self.on_variable_change('remove', index, None)
+        # Remove right away and offer an undo instead of asking for confirmation
+        name = self.variable_names.pop(index)
+        coeff = None
+        if index < len(self.objective_coeffs):
+            coeff = float(self.objective_coeffs[index])
+            self._delete_value('objective', index)
+        self.num_variables -= 1
+        
+        # Remove column from constraint matrix
+        column = None
+        if self._matrix_buf is not None and self._matrix_shape[1] > index:
+            column = self.constraint_matrix[:, index].copy()
+            self._shrink_matrix(axis=1, index=index)
+        
+        self._undo_stack.append((index, name, coeff, column))
+        del self._undo_stack[:-self.UNDO_LIMIT]
+        self._show_undo_toast(f"Removed variable '{name}'")
+        
+        self._refresh_tabs("Variables", "Objective")
+        
+        if self.on_variable_change:
+            self.on_variable_change('remove', index, None)
+    
+    def _undo_remove_variable(self):
+        """Restore the most recently removed variable"""
+        if not self._undo_stack:
+            return
+        index, name, coeff, column = self._undo_stack.pop()
+        index = min(index, len(self.variable_names))
+        
+        self.variable_names.insert(index, name)
+        if coeff is not None:
+            self._insert_value('objective', min(index, len(self.objective_coeffs)), coeff)
+        self.num_variables += 1
+        
+        # Put the column back, shifting later columns right
+        if column is not None and self._matrix_buf is not None:
+            self._grow_matrix(axis=1)
+            rows, cols = self._matrix_shape
+            self._matrix_buf[:rows, index + 1:cols] = self._matrix_buf[:rows, index:cols - 1]
+            self._matrix_buf[:rows, index] = 0.0
+            count = min(rows, len(column))
+            self._matrix_buf[:count, index] = column[:count]
+        
+        if self._undo_stack:
+            self._show_undo_toast(f"Removed variable '{self._undo_stack[-1][1]}'")
+        else:
+            self._hide_undo_toast()
+        
+        self._refresh_tabs("Variables", "Objective")
+        
+        if self.on_variable_change:
+            self.on_variable_change('add', index, name)
+    
+    def _show_undo_toast(self, text: str):
+        """Show the undo bar above the tabs, hiding it again after UNDO_TIMEOUT_MS"""
+        if self._undo_toast is None:
+            self._undo_toast = ctk.CTkFrame(self, fg_color=COLORS.get("text_primary", "#1E293B"))
+            self._undo_toast_label = ctk.CTkLabel(self._undo_toast, text="", text_color="white")
+            self._undo_toast_label.pack(side="left", padx=10, pady=5)
+            ctk.CTkButton(
+                self._undo_toast,
+                text="Undo",
+                width=70,
+                height=26,
+                fg_color=COLORS.get("accent", "#FF6B35"),
+                command=self._undo_remove_variable
+            ).pack(side="right", padx=10, pady=5)
+        
+        self._undo_toast_label.configure(text=text)
+        self._undo_toast.pack(fill="x", padx=15, before=self.tabview)
+        
+        if self._undo_after_id is not None:
+            self.after_cancel(self._undo_after_id)
+        self._undo_after_id = self.after(self.UNDO_TIMEOUT_MS, self._hide_undo_toast)
+    
+    def _hide_undo_toast(self):
+        """Hide the undo bar; removals can no longer be undone"""
+        if self._undo_after_id is not None:
+            self.after_cancel(self._undo_after_id)
+            self._undo_after_id = None
+        self._undo_stack.clear()
+        if self._undo_toast is not None:
+            self._undo_toast.pack_forget()
     
     def _add_constraint(self):
         """Add a new constraint"""
@@ -787,18 +1288,16 @@ class WhatIfPanel(ctk.CTkFrame):
         new_name = f"Constraint {new_idx}"
         
         self.constraint_names.append(new_name)
-        self.rhs_values.append(0.0)
+        self._insert_value('rhs', len(self.rhs_values))
         self.num_constraints += 1
         
         # Add row to constraint matrix
-        if self.constraint_matrix is not None:
-            new_row = np.zeros((1, self.constraint_matrix.shape[1]))
-            self.constraint_matrix = np.vstack([self.constraint_matrix, new_row])
+        if self._matrix_buf is not None:
+            self._grow_matrix(axis=0)
         elif self.num_variables > 0:
             self.constraint_matrix = np.zeros((1, self.num_variables))
         
-        self._refresh_constraints_display()
-        self._refresh_rhs_display()
+        self._refresh_tabs("Constraints", "RHS Values")
         
         if self.on_constraint_change:
             self.on_constraint_change('add', new_idx - 1, new_name)
@@ -812,15 +1311,14 @@ class WhatIfPanel(ctk.CTkFrame):
         if messagebox.askyesno("Confirm Delete", f"Remove constraint '{self.constraint_names[index]}'?"):
             del self.constraint_names[index]
             if index < len(self.rhs_values):
-                del self.rhs_values[index]
+                self._delete_value('rhs', index)
             self.num_constraints -= 1
             
             # Remove row from constraint matrix
-            if self.constraint_matrix is not None and self.constraint_matrix.shape[0] > index:
-                self.constraint_matrix = np.delete(self.constraint_matrix, index, axis=0)
+            if self._matrix_buf is not None and self._matrix_shape[0] > index:
+                self._shrink_matrix(axis=0, index=index)
             
-            self._refresh_constraints_display()
-            self._refresh_rhs_display()
+            self._refresh_tabs("Constraints", "RHS Values")
             
             if self.on_constraint_change:
                 self.on_constraint_change('remove', index, None)
@@ -831,138 +1329,77 @@ class WhatIfPanel(ctk.CTkFrame):
             messagebox.showwarning("No Data", "No constraint matrix data available.")
             return
         
-        # Create dialog window
-        dialog = ctk.CTkToplevel(self)
-        dialog.title(f"Edit Constraint: {self.constraint_names[constraint_index]}")
-        dialog.geometry("500x400")
-        dialog.transient(self.winfo_toplevel())
-        dialog.grab_set()
-        
-        # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() - 500) // 2
-        y = (dialog.winfo_screenheight() - 400) // 2
-        dialog.geometry(f"+{x}+{y}")
-        
-        # Title
-        ctk.CTkLabel(
-            dialog,
-            text=f"Edit Coefficients for {self.constraint_names[constraint_index]}",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=COLORS.get("primary", "#0F4C75")
-        ).pack(pady=15)
-        
-        # Description
-        ctk.CTkLabel(
-            dialog,
-            text="Modify the coefficient for each variable in this constraint:",
-            font=ctk.CTkFont(size=11),
-            text_color=COLORS.get("text_secondary", "#64748B")
-        ).pack(pady=5)
-        
-        # Scrollable frame for coefficients
-        coeff_frame = ctk.CTkScrollableFrame(dialog, height=250)
-        coeff_frame.pack(fill="both", expand=True, padx=20, pady=10)
-        
-        # Create header
-        header = ctk.CTkFrame(coeff_frame, fg_color="transparent")
-        header.pack(fill="x", pady=5)
-        ctk.CTkLabel(header, text="Variable", width=150, font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
-        ctk.CTkLabel(header, text="Coefficient", width=100, font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
-        
-        # Store entries
-        coeff_entries = []
-        
-        # Create entry for each variable
-        for i in range(self.num_variables):
-            row = ctk.CTkFrame(coeff_frame, fg_color=COLORS.get("background", "#F8FAFC"))
-            row.pack(fill="x", pady=2)
-            
-            var_name = self.variable_names[i] if i < len(self.variable_names) else f"x{i+1}"
-            ctk.CTkLabel(
-                row,
-                text=var_name[:20],
-                width=150,
-                anchor="w"
-            ).pack(side="left", padx=10, pady=5)
-            
-            current_val = self.constraint_matrix[constraint_index, i] if constraint_index < self.constraint_matrix.shape[0] else 0
-            entry = ctk.CTkEntry(row, width=100, height=28)
-            entry.insert(0, str(current_val))
-            entry.pack(side="left", padx=5)
-            coeff_entries.append(entry)
-        
-        # Button frame
-        btn_frame = ctk.CTkFrame(dialog, fg_color="transparent")
-        btn_frame.pack(fill="x", padx=20, pady=15)
-        
-        def apply_changes():
-            """Apply coefficient changes"""
-            for i, entry in enumerate(coeff_entries):
-                try:
-                    val = float(entry.get())
-                    if constraint_index < self.constraint_matrix.shape[0] and i < self.constraint_matrix.shape[1]:
-                        self.constraint_matrix[constraint_index, i] = val
-                except ValueError:
-                    pass
-            dialog.destroy()
-            messagebox.showinfo("Applied", f"Coefficients for {self.constraint_names[constraint_index]} updated. Click 'Re-Solve' to see results.")
-        
-        def cancel():
-            """Cancel without saving"""
-            dialog.destroy()
-        
-        ctk.CTkButton(
-            btn_frame,
-            text="Cancel",
-            width=100,
-            fg_color=COLORS.get("text_secondary", "#64748B"),
-            hover_color="#475569",
-            command=cancel
-        ).pack(side="left", padx=10)
-        
-        ctk.CTkButton(
-            btn_frame,
-            text="Apply Changes",
-            width=120,
-            fg_color=COLORS.get("success", "#00C853"),
-            hover_color="#00A040",
-            command=apply_changes
-        ).pack(side="right", padx=10)
+        const_name = self.constraint_names[constraint_index]
+        
+        matrix = self.constraint_matrix
+        values = matrix[constraint_index] if constraint_index < matrix.shape[0] else np.zeros(0)
+        names = [
+            self.variable_names[i] if i < len(self.variable_names) else f"x{i+1}"
+            for i in range(self.num_variables)
+        ]
+        
+        self._open_edit_dialog(
+            title=f"Edit Constraint: {const_name}",
+            heading=f"Edit Coefficients for {const_name}",
+            description="Modify the coefficient for each variable in this constraint:",
+            name_column="Variable",
+            names=names,
+            values=self._padded_values(values, len(names)),
+            target=('constraint', constraint_index, const_name)
+        )
 
     def _apply_objective_changes(self):
         """Apply changes to objective coefficients"""
-        if hasattr(self, 'obj_entries'):
-            for i, entry in enumerate(self.obj_entries):
-                try:
-                    val = float(entry.get())
-                    if i < len(self.objective_coeffs):
-                        self.objective_coeffs[i] = val
-                except ValueError:
-                    pass
-        
-        messagebox.showinfo("Applied", "Objective coefficient changes applied. Click 'Re-Solve' to see results.")
+        self._schedule_apply('objective')
     
     def _apply_rhs_changes(self):
         """Apply changes to RHS values"""
-        if hasattr(self, 'rhs_entries'):
-            for i, entry in enumerate(self.rhs_entries):
-                try:
-                    val = float(entry.get())
-                    if i < len(self.rhs_values):
-                        self.rhs_values[i] = val
-                except ValueError:
-                    pass
-        
-        messagebox.showinfo("Applied", "RHS value changes applied. Click 'Re-Solve' to see results.")
+        self._schedule_apply('rhs')
+    
+    def _schedule_apply(self, kind: str):
+        """Queue an apply, coalescing requests made within APPLY_DEBOUNCE_MS"""
+        self._pending_apply.add(kind)
+        if self._apply_after_id is not None:
+            self.after_cancel(self._apply_after_id)
+        self._apply_after_id = self.after(self.APPLY_DEBOUNCE_MS, self._do_apply)
+    
+    def _do_apply(self, notify: bool = True):
+        """Store the entry values of every queued kind and report once"""
+        self._apply_after_id = None
+        pending, self._pending_apply = self._pending_apply, set()
+        
+        applied = []
+        if 'objective' in pending:
+            if hasattr(self, 'obj_entries'):
+                self._store_parsed(self.objective_coeffs, self.obj_entries)
+            applied.append("Objective coefficient")
+        if 'rhs' in pending:
+            if hasattr(self, 'rhs_entries'):
+                self._store_parsed(self.rhs_values, self.rhs_entries)
+            applied.append("RHS value")
+        
+        if applied and notify:
+            messagebox.showinfo("Applied", f"{' and '.join(applied)} changes applied. Click 'Re-Solve' to see results.")
     
     def _on_resolve(self):
         """Trigger re-solve with current modifications"""
         if self.on_resolve:
             self.on_resolve()
     
+    def set_resolving(self, resolving: bool):
+        """Disable the re-solve button while a re-solve is running"""
+        if resolving:
+            self.resolve_btn.configure(state="disabled", text="Solving...")
+        else:
+            self.resolve_btn.configure(state="normal", text="⟳ Re-Solve")
+    
     def get_modified_problem(self) -> Dict[str, Any]:
         """Get the modified problem data"""
+        # Store an apply still waiting out its debounce, so the solve sees it
+        if self._apply_after_id is not None:
+            self.after_cancel(self._apply_after_id)
+            self._do_apply(notify=False)
+        
         return {
             'num_variables': self.num_variables,
             'num_constraints': self.num_constraints,
@@ -973,10 +1410,7 @@ class WhatIfPanel(ctk.CTkFrame):
             'rhs_values': self.rhs_values
         }
     
-    def update_solution(self, solution: Dict[str, Any]):
+    def update_solution(self, solution: LPResult):
         """Update with new solution after re-solve"""
         self.solution = solution
-        self._refresh_variables_display()
-        self._refresh_constraints_display()
-        self._refresh_rhs_display()
-        self._refresh_ranges_display()
+        self._refresh_tabs("Variables", "Constraints", "RHS Values", "Ranges")
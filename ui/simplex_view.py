@@ -5,16 +5,42 @@ UI for inputting and solving LP problems with sensitivity analysis
 
 import customtkinter as ctk
 import numpy as np
+import scipy.sparse as sp
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import messagebox
-from typing import Optional, List
+from typing import Callable, Dict, Optional, List
 
 from ui.components.matrix_input import MatrixInput, VectorInput
 from ui.components.result_display import ResultDisplay
 from ui.components.sensitivity_table import SensitivityTable
 from ui.components.what_if_panel import WhatIfPanel
 from algorithms.simplex import SimplexSolver, create_sample_problem
+from models.lp_model import LPResult
 from config.settings import PRODUCTS, RESOURCES, DEFAULT_LP_VARIABLES, DEFAULT_LP_CONSTRAINTS, COLORS
 
+# PP Chemicals sample problem, built once at import (read-only)
+# Profit per ton
+_SAMPLE_OBJECTIVE = np.array([5000, 7500, 4000, 3500, 6000, 4500, 8000, 3000, 9000, 8500], dtype=np.int32)
+_SAMPLE_OBJECTIVE.flags.writeable = False
+
+_SAMPLE_CONSTRAINTS = np.array([
+    [2, 3, 1, 2, 1, 2, 3, 1, 2, 3],    # Raw Material A
+    [1, 2, 3, 1, 2, 1, 2, 3, 1, 2],    # Raw Material B
+    [3, 2, 4, 1, 2, 3, 1, 2, 4, 2],    # Production Line 1
+    [1, 2, 1, 3, 4, 2, 1, 2, 1, 3],    # Production Line 2
+    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],    # Storage
+    [4, 5, 3, 4, 5, 3, 4, 5, 3, 4],    # Labor
+    [0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5],  # QC
+    [0.1, 0.2, 0.15, 0.1, 0.2, 0.15, 0.1, 0.2, 0.15, 0.1],  # Environmental
+    [10, 15, 8, 12, 10, 8, 15, 10, 12, 14],  # Energy
+    [1, 2, 1, 1, 2, 1, 2, 1, 1, 2]     # Packaging
+], dtype=np.float64)
+_SAMPLE_CONSTRAINTS.flags.writeable = False
+
+# Resource availability
+_SAMPLE_RHS = np.array([5000, 4000, 480, 400, 1000, 2000, 300, 100, 10000, 2500], dtype=np.int32)
+_SAMPLE_RHS.flags.writeable = False
+
 
 class SimplexView(ctk.CTkFrame):
     """
@@ -28,12 +54,34 @@ class SimplexView(ctk.CTkFrame):
     - Load sample problem
     """
     
+    # Constraint matrices with fewer non-zeros than this fraction go to the solver as CSR
+    SPARSE_DENSITY = 0.3
+    # What-if add/remove edits within this many ms are reported together
+    CHANGE_NOTICE_MS = 250
+    
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
         
         self.num_variables = DEFAULT_LP_VARIABLES
         self.num_constraints = DEFAULT_LP_CONSTRAINTS
         
+        # Names used by the main solve and labels of the input widgets,
+        # rebuilt only when the problem is resized
+        self._var_names = self._variable_names(self.num_variables)
+        self._const_names = self._constraint_names(self.num_constraints)
+        self._recompute_labels()
+        
+        # Solves and what-if re-solves run on a single worker thread to keep the UI responsive
+        self._solver_executor = ThreadPoolExecutor(max_workers=1)
+        self._solve_future: Optional[Future] = None
+        self._whatif_future: Optional[Future] = None
+        # Pending after() ids of the polls waiting on each future
+        self._poll_after_ids: Dict[Future, str] = {}
+        
+        # What-if add/remove counts per (kind, action) waiting for the notice timer
+        self._pending_changes = {}
+        self._change_after_id = None
+        
         self._create_layout()
         self._create_widgets()
     
@@ -152,7 +200,7 @@ class SimplexView(ctk.CTkFrame):
         self.objective_input = VectorInput(
             obj_frame,
             size=self.num_variables,
-            labels=PRODUCTS[:self.num_variables],
+            labels=list(self._var_names),
             orientation="horizontal",
             default_value="0",
             cell_width=90
@@ -175,8 +223,9 @@ class SimplexView(ctk.CTkFrame):
             const_frame,
             rows=self.num_constraints,
             cols=self.num_variables,
-            row_headers=RESOURCES[:self.num_constraints],
-            col_headers=[p[:12] for p in PRODUCTS[:self.num_variables]],
+            # Headers are copied because MatrixInput extends its header lists on resize
+            row_headers=list(self._const_labels),
+            col_headers=list(self._var_labels_short),
             default_value="0",
             cell_width=70
         )
@@ -195,7 +244,7 @@ class SimplexView(ctk.CTkFrame):
         self.rhs_input = VectorInput(
             rhs_frame,
             size=self.num_constraints,
-            labels=RESOURCES[:self.num_constraints],
+            labels=list(self._const_labels),
             orientation="vertical",
             default_value="0",
             cell_width=100
@@ -207,7 +256,7 @@ class SimplexView(ctk.CTkFrame):
         btn_frame = ctk.CTkFrame(self.left_panel)
         btn_frame.pack(fill="x", padx=10, pady=10)
         
-        ctk.CTkButton(
+        self.solve_btn = ctk.CTkButton(
             btn_frame,
             text="🔍 Solve Problem",
             command=self._solve,
@@ -216,7 +265,8 @@ class SimplexView(ctk.CTkFrame):
             font=ctk.CTkFont(size=14, weight="bold"),
             fg_color="#1E5B8C",
             hover_color="#164569"
-        ).pack(side="left", padx=10, pady=10)
+        )
+        self.solve_btn.pack(side="left", padx=10, pady=10)
         
         ctk.CTkButton(
             btn_frame,
@@ -247,12 +297,18 @@ class SimplexView(ctk.CTkFrame):
         )
         self.result_display.pack(fill="both", expand=True, padx=5, pady=5)
         
-        # Sensitivity analysis table
-        self.sensitivity_table = SensitivityTable(
-            self.middle_panel,
-            title="Sensitivity Analysis"
-        )
-        self.sensitivity_table.pack(fill="both", expand=True, padx=5, pady=5)
+        # Sensitivity analysis table, built on the first report to display
+        self.sensitivity_table: Optional[SensitivityTable] = None
+    
+    def _get_sensitivity_table(self) -> SensitivityTable:
+        """Return the sensitivity table, creating it on first use"""
+        if self.sensitivity_table is None:
+            self.sensitivity_table = SensitivityTable(
+                self.middle_panel,
+                title="Sensitivity Analysis"
+            )
+            self.sensitivity_table.pack(fill="both", expand=True, padx=5, pady=5)
+        return self.sensitivity_table
     
     def _create_whatif_panel(self):
         """Create the What-If analysis panel"""
@@ -304,45 +360,70 @@ class SimplexView(ctk.CTkFrame):
     
     def _on_variable_change(self, action: str, index: int, name: str):
         """Handle variable addition/removal from What-If panel"""
-        if action == 'add':
-            # Update the main input fields to reflect the change
-            messagebox.showinfo(
-                "Variable Added", 
-                f"Variable added. Click 'Re-Solve' in the What-If panel to update results."
-            )
-        elif action == 'remove':
-            messagebox.showinfo(
-                "Variable Removed", 
-                f"Variable removed. Click 'Re-Solve' in the What-If panel to update results."
-            )
+        self._queue_change_notice('variable', action)
     
     def _on_constraint_change(self, action: str, index: int, name: str):
         """Handle constraint addition/removal from What-If panel"""
-        if action == 'add':
-            messagebox.showinfo(
-                "Constraint Added", 
-                f"Constraint added. Click 'Re-Solve' in the What-If panel to update results."
-            )
-        elif action == 'remove':
-            messagebox.showinfo(
-                "Constraint Removed", 
-                f"Constraint removed. Click 'Re-Solve' in the What-If panel to update results."
-            )
+        self._queue_change_notice('constraint', action)
+    
+    def _queue_change_notice(self, kind: str, action: str):
+        """Queue a what-if edit notice, coalescing edits made within CHANGE_NOTICE_MS"""
+        key = (kind, action)
+        self._pending_changes[key] = self._pending_changes.get(key, 0) + 1
+        if self._change_after_id is not None:
+            self.after_cancel(self._change_after_id)
+        self._change_after_id = self.after(self.CHANGE_NOTICE_MS, self._show_change_notice)
+    
+    def _show_change_notice(self):
+        """Report the queued what-if edits once in the status bar"""
+        self._change_after_id = None
+        pending, self._pending_changes = self._pending_changes, {}
+        
+        past = {'add': 'added', 'remove': 'removed'}
+        parts = [
+            f"{count} {kind}{'s' if count > 1 else ''} {past.get(action, action)}"
+            for (kind, action), count in pending.items()
+        ]
+        if parts:
+            self.result_display.set_status(True, f"{', '.join(parts).capitalize()}. Click 'Re-Solve' to update results.")
     
     def _resolve_whatif(self):
         """Re-solve with modified parameters from What-If panel"""
-        try:
-            # Get modified problem data
-            problem = self.whatif_panel.get_modified_problem()
-            
-            c = np.array(problem['objective_coeffs'])
-            A_ub = problem['constraint_matrix']
-            b_ub = np.array(problem['rhs_values'])
-            var_names = problem['variable_names']
-            const_names = problem['constraint_names']
-            maximize = self.objective_var.get() == "maximize"
-            
-            # Create and solve
+        # Ignore clicks while a re-solve is still running
+        if self._whatif_future is not None and not self._whatif_future.done():
+            return
+        
+        # Read all widget state here; the worker thread must not touch Tk
+        problem = self.whatif_panel.get_modified_problem()
+        maximize = self.objective_var.get() == "maximize"
+        var_names = list(problem['variable_names'])
+        
+        self.whatif_panel.set_resolving(True)
+        # Copy the arrays here: the panel edits them in place while the worker solves
+        self._whatif_future = self._solver_executor.submit(
+            self._run_solver,
+            np.array(problem['objective_coeffs']),
+            self._solver_matrix(np.array(problem['constraint_matrix'])) if problem['constraint_matrix'] is not None else None,
+            np.array(problem['rhs_values']),
+            maximize,
+            var_names,
+            list(problem['constraint_names']),
+            self.last_solver,
+            self.last_result
+        )
+        self._schedule_poll(self._whatif_future, self._show_whatif_result, var_names)
+    
+    @staticmethod
+    def _run_solver(c, A_ub, b_ub, maximize, var_names, const_names, last_solver=None, last_result=None):
+        """
+        Solve a problem and build its result dictionary (runs on the solver thread)
+        
+        If last_solver already holds exactly this problem, its result is
+        reused instead of solving again.
+        """
+        if last_result is not None and last_solver.matches(c, A_ub, b_ub, maximize, var_names, const_names):
+            solver, result = last_solver, last_result
+        else:
             solver = SimplexSolver(
                 c=c,
                 A_ub=A_ub,
@@ -351,37 +432,78 @@ class SimplexView(ctk.CTkFrame):
                 variable_names=var_names,
                 constraint_names=const_names
             )
-            
             result = solver.solve()
+        
+        # Get sensitivity report with ranges
+        sens_report = None
+        if result.success and result.sensitivity:
+            sens_report = solver.get_sensitivity_report()
+        
+        lp_result = LPResult(
+            success=result.success,
+            message=result.message,
+            optimal_value=result.optimal_value,
+            solution=result.solution,
+            iterations=result.iterations
+        )
+        if result.sensitivity:
+            lp_result.shadow_prices = result.sensitivity.shadow_prices
+            lp_result.reduced_costs = result.sensitivity.reduced_costs
+            lp_result.slack_values = result.sensitivity.slack_values
+        if sens_report:
+            lp_result.objective_ranges = sens_report.get('objective_ranges', [])
+            lp_result.rhs_ranges = sens_report.get('rhs_ranges', [])
+        
+        return solver, result, lp_result, sens_report
+    
+    @classmethod
+    def _solver_matrix(cls, A_ub: np.ndarray):
+        """Return A_ub as a CSR matrix if it is mostly zeros, else unchanged"""
+        if A_ub.size and np.count_nonzero(A_ub) / A_ub.size < cls.SPARSE_DENSITY:
+            return sp.csr_matrix(A_ub)
+        return A_ub
+    
+    def _schedule_poll(self, future: Future, on_done: Callable, *args):
+        """Check a background solve again in 50 ms"""
+        self._poll_after_ids[future] = self.after(50, self._poll_solver, future, on_done, *args)
+    
+    def _poll_solver(self, future: Future, on_done: Callable, *args):
+        """Wait for a background solve to finish, then call on_done(future, *args)"""
+        if not future.done():
+            self._schedule_poll(future, on_done, *args)
+            return
+        self._poll_after_ids.pop(future, None)
+        on_done(future, *args)
+    
+    def destroy(self):
+        """Cancel pending polls and timers and stop the solver thread before destroying the view"""
+        for after_id in self._poll_after_ids.values():
+            self.after_cancel(after_id)
+        self._poll_after_ids.clear()
+        if self._change_after_id is not None:
+            self.after_cancel(self._change_after_id)
+            self._change_after_id = None
+        self._solver_executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+    
+    def _show_whatif_result(self, future: Future, var_names: List[str]):
+        """Show the results of a finished what-if re-solve"""
+        self.whatif_panel.set_resolving(False)
+        try:
+            solver, result, lp_result, sens_report = future.result()
             
-            # Build result dictionary
-            result_dict = {
-                'success': result.success,
-                'message': result.message,
-                'optimal_value': result.optimal_value,
-                'solution': result.solution,
-                'iterations': result.iterations
-            }
-            
-            if result.sensitivity:
-                result_dict['shadow_prices'] = result.sensitivity.shadow_prices
-                result_dict['slack_values'] = result.sensitivity.slack_values
-            
-            # Get sensitivity report with ranges
-            if result.success and result.sensitivity:
-                sens_report = solver.get_sensitivity_report()
-                result_dict['objective_ranges'] = sens_report.get('objective_ranges', [])
-                result_dict['rhs_ranges'] = sens_report.get('rhs_ranges', [])
+            # The next re-solve can reuse this one if nothing changes
+            self.last_result = result
+            self.last_solver = solver
             
             # Update What-If panel with new solution
-            self.whatif_panel.update_solution(result_dict)
+            self.whatif_panel.update_solution(lp_result)
             
             # Update main displays
-            self.result_display.display_lp_result(result_dict, var_names)
+            self.result_display.display_lp_result(lp_result, var_names)
             
-            if result.success and result.sensitivity:
-                sens_report = solver.get_sensitivity_report()
-                self.sensitivity_table.display_full_analysis(sens_report)
+            if sens_report is not None:
+                self._get_sensitivity_table().display_full_analysis(sens_report)
             
             messagebox.showinfo("Re-Solved", "Problem re-solved with modified parameters!")
             
@@ -390,143 +512,105 @@ class SimplexView(ctk.CTkFrame):
     
     def _load_sample(self):
         """Load sample PP Chemicals problem"""
-        # Sample objective coefficients (profit per ton)
-        objectives = np.array([5000, 7500, 4000, 3500, 6000, 4500, 8000, 3000, 9000, 8500])
-        self.objective_input.set_values(objectives)
-        
-        # Sample constraint matrix
-        constraints = np.array([
-            [2, 3, 1, 2, 1, 2, 3, 1, 2, 3],    # Raw Material A
-            [1, 2, 3, 1, 2, 1, 2, 3, 1, 2],    # Raw Material B
-            [3, 2, 4, 1, 2, 3, 1, 2, 4, 2],    # Production Line 1
-            [1, 2, 1, 3, 4, 2, 1, 2, 1, 3],    # Production Line 2
-            [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],    # Storage
-            [4, 5, 3, 4, 5, 3, 4, 5, 3, 4],    # Labor
-            [0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5],  # QC
-            [0.1, 0.2, 0.15, 0.1, 0.2, 0.15, 0.1, 0.2, 0.15, 0.1],  # Environmental
-            [10, 15, 8, 12, 10, 8, 15, 10, 12, 14],  # Energy
-            [1, 2, 1, 1, 2, 1, 2, 1, 1, 2]     # Packaging
-        ])
-        self.constraint_matrix.set_matrix(constraints)
-        
-        # Sample RHS values
-        rhs = np.array([5000, 4000, 480, 400, 1000, 2000, 300, 100, 10000, 2500])
-        self.rhs_input.set_values(rhs)
+        self.objective_input.set_values(_SAMPLE_OBJECTIVE)
+        self.constraint_matrix.set_matrix(_SAMPLE_CONSTRAINTS)
+        self.rhs_input.set_values(_SAMPLE_RHS)
         
         # Set to maximize
         self.objective_var.set("maximize")
     
     def _resize_problem(self):
         """Resize the problem dimensions"""
-        try:
-            new_vars = int(self.var_spinbox.get())
-            new_const = int(self.const_spinbox.get())
-            
-            if new_vars < 1 or new_const < 1:
-                return
-            
-            self.num_variables = new_vars
-            self.num_constraints = new_const
-            
-            # Recreate input widgets
-            self.objective_input.destroy()
-            self.constraint_matrix.destroy()
-            self.rhs_input.destroy()
-            
-            # Update headers
-            var_labels = [PRODUCTS[i] if i < len(PRODUCTS) else f"x{i+1}" for i in range(new_vars)]
-            const_labels = [RESOURCES[i] if i < len(RESOURCES) else f"C{i+1}" for i in range(new_const)]
-            
-            # Recreate objective input
-            obj_parent = self.left_panel.winfo_children()[2]  # Objective frame
-            self.objective_input = VectorInput(
-                obj_parent,
-                size=new_vars,
-                labels=var_labels,
-                orientation="horizontal",
-                default_value="0",
-                cell_width=90
-            )
-            self.objective_input.pack(fill="x", padx=10, pady=5)
-            
-            # Recreate constraint matrix
-            const_parent = self.left_panel.winfo_children()[3]  # Constraint frame
-            self.constraint_matrix = MatrixInput(
-                const_parent,
-                rows=new_const,
-                cols=new_vars,
-                row_headers=const_labels,
-                col_headers=[v[:12] for v in var_labels],
-                default_value="0",
-                cell_width=70
-            )
-            self.constraint_matrix.pack(fill="both", expand=True, padx=10, pady=5)
-            
-            # Recreate RHS input
-            rhs_parent = const_parent.winfo_children()[-1]  # RHS frame
-            self.rhs_input = VectorInput(
-                rhs_parent,
-                size=new_const,
-                labels=const_labels,
-                orientation="vertical",
-                default_value="0",
-                cell_width=100
-            )
-            self.rhs_input.pack(fill="x", padx=10, pady=5)
-            
-        except ValueError:
-            pass
+        # Validate both sizes before touching any widget
+        vars_text = self.var_spinbox.get().strip()
+        const_text = self.const_spinbox.get().strip()
+        if not (vars_text.isdecimal() and const_text.isdecimal()):
+            return
+        new_vars = int(vars_text)
+        new_const = int(const_text)
+        
+        if new_vars < 1 or new_const < 1:
+            return
+        
+        vars_changed = new_vars != self.num_variables
+        const_changed = new_const != self.num_constraints
+        if not (vars_changed or const_changed):
+            return
+        
+        self.num_variables = new_vars
+        self.num_constraints = new_const
+        if vars_changed:
+            self._var_names = self._variable_names(new_vars)
+        if const_changed:
+            self._const_names = self._constraint_names(new_const)
+        self._recompute_labels()
+        
+        # Resize the input widgets in place, keeping the values already entered;
+        # only the inputs along a changed dimension are touched
+        if vars_changed:
+            self.objective_input.resize(new_vars, list(self._var_names))
+            self.constraint_matrix.set_col_headers(list(self._var_labels_short))
+        if const_changed:
+            self.constraint_matrix.set_row_headers(list(self._const_labels))
+            self.rhs_input.resize(new_const, list(self._const_labels))
+        self.constraint_matrix.resize(new_const, new_vars)
+    
+    def _recompute_labels(self):
+        """Rebuild the input labels that differ from the solve names"""
+        self._var_labels_short = tuple(name[:12] for name in self._var_names)
+        # Constraints past the named resources are labelled "C{i}" rather than "Constraint {i}"
+        self._const_labels = tuple(
+            name if i < len(RESOURCES) else f"C{i+1}" for i, name in enumerate(self._const_names)
+        )
+    
+    @staticmethod
+    def _variable_names(n: int) -> List[str]:
+        """Names of the first n decision variables"""
+        return [PRODUCTS[i] if i < len(PRODUCTS) else f"x{i+1}" for i in range(n)]
+    
+    @staticmethod
+    def _constraint_names(n: int) -> List[str]:
+        """Names of the first n constraints"""
+        return [RESOURCES[i] if i < len(RESOURCES) else f"Constraint {i+1}" for i in range(n)]
     
     def _solve(self):
         """Solve the LP problem"""
+        # Ignore clicks while a solve is still running
+        if self._solve_future is not None and not self._solve_future.done():
+            return
+        
         try:
             # Get input data
             c = self.objective_input.get_values()
             A_ub = self.constraint_matrix.get_matrix()
             b_ub = self.rhs_input.get_values()
             maximize = self.objective_var.get() == "maximize"
+            var_names = self._var_names
+            const_names = self._const_names
             
-            # Get variable names
-            var_names = [PRODUCTS[i] if i < len(PRODUCTS) else f"x{i+1}" 
-                        for i in range(self.num_variables)]
-            const_names = [RESOURCES[i] if i < len(RESOURCES) else f"Constraint {i+1}"
-                          for i in range(self.num_constraints)]
-            
-            # Create and solve
-            solver = SimplexSolver(
-                c=c,
-                A_ub=A_ub,
-                b_ub=b_ub,
-                maximize=maximize,
-                variable_names=var_names,
-                constraint_names=const_names
+            # Solve on the worker thread; the poll shows the results here
+            self.solve_btn.configure(state="disabled", text="⏳ Solving...")
+            self._solve_future = self._solver_executor.submit(
+                self._run_solver, c, self._solver_matrix(A_ub), b_ub, maximize, var_names, const_names
             )
+            self._schedule_poll(self._solve_future, self._show_solve_result,
+                                c, A_ub, b_ub, var_names, const_names)
             
-            result = solver.solve()
+        except Exception as e:
+            self.result_display.set_status(False, f"Error: {str(e)}")
+    
+    def _show_solve_result(self, future: Future, c, A_ub, b_ub, var_names: List[str], const_names: List[str]):
+        """Show the results of a finished solve and load them into the What-If panel"""
+        self.solve_btn.configure(state="normal", text="🔍 Solve Problem")
+        try:
+            solver, result, lp_result, sens_report = future.result()
             
             # Display results
-            result_dict = {
-                'success': result.success,
-                'message': result.message,
-                'optimal_value': result.optimal_value,
-                'solution': result.solution,
-                'iterations': result.iterations
-            }
-            
-            if result.sensitivity:
-                result_dict['shadow_prices'] = result.sensitivity.shadow_prices
-                result_dict['slack_values'] = result.sensitivity.slack_values
-            
-            self.result_display.display_lp_result(result_dict, var_names)
+            self.result_display.display_lp_result(lp_result, var_names)
             
             # Display sensitivity analysis
-            if result.success and result.sensitivity:
-                sens_report = solver.get_sensitivity_report()
-                self.sensitivity_table.display_full_analysis(sens_report)
-                
-                # Add ranges to result dict for What-If panel
-                result_dict['objective_ranges'] = sens_report.get('objective_ranges', [])
-                result_dict['rhs_ranges'] = sens_report.get('rhs_ranges', [])
+            if sens_report is not None:
+                self._get_sensitivity_table().display_full_analysis(sens_report)
             
             # Store for What-If analysis
             self.last_result = result
@@ -534,14 +618,14 @@ class SimplexView(ctk.CTkFrame):
             
             # Load problem into What-If panel
             self.whatif_panel.load_problem(
-                num_variables=self.num_variables,
-                num_constraints=self.num_constraints,
+                num_variables=len(var_names),
+                num_constraints=len(const_names),
                 variable_names=var_names,
                 constraint_names=const_names,
                 objective_coeffs=c,
                 constraint_matrix=A_ub,
                 rhs_values=b_ub,
-                solution=result_dict
+                solution=lp_result
             )
             
         except Exception as e:
@@ -553,7 +637,8 @@ class SimplexView(ctk.CTkFrame):
         self.constraint_matrix.clear()
         self.rhs_input.clear()
         self.result_display.clear()
-        self.sensitivity_table.clear()
+        if self.sensitivity_table is not None:
+            self.sensitivity_table.clear()
         # Reset What-If panel
         self.whatif_panel.load_problem(
             num_variables=0,
@@ -563,7 +648,7 @@ class SimplexView(ctk.CTkFrame):
             objective_coeffs=[],
             constraint_matrix=None,
             rhs_values=[],
-            solution={}
+            solution=None
         )
         self.last_result = None
         self.last_solver = None
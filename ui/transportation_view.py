@@ -12,6 +12,30 @@ from ui.components.result_display import ResultDisplay, AllocationMatrixDisplay
 from algorithms.transportation import TransportationSolver, InitialMethod
 from config.settings import PLANTS, DESTINATIONS, DEFAULT_MATRIX_SIZE
 
+# PP Chemicals sample problem, built once at import (read-only)
+# Supply from 10 plants
+_SAMPLE_SUPPLY = np.array([500, 400, 350, 450, 380, 420, 300, 360, 410, 330], dtype=np.int32)
+_SAMPLE_SUPPLY.flags.writeable = False
+
+# Demand at 10 construction sites
+_SAMPLE_DEMAND = np.array([200, 180, 300, 250, 350, 280, 320, 400, 290, 330], dtype=np.int32)
+_SAMPLE_DEMAND.flags.writeable = False
+
+# Transportation cost matrix
+_SAMPLE_COSTS = np.array([
+    [45, 72, 35, 58, 62, 48, 55, 80, 42, 65],
+    [38, 65, 42, 52, 58, 45, 50, 75, 38, 60],
+    [55, 48, 58, 42, 45, 52, 48, 62, 55, 45],
+    [62, 55, 48, 38, 42, 55, 52, 58, 48, 42],
+    [70, 58, 52, 45, 38, 48, 45, 52, 55, 48],
+    [58, 52, 55, 48, 45, 35, 42, 48, 52, 55],
+    [85, 78, 72, 65, 58, 52, 45, 38, 65, 58],
+    [78, 72, 65, 58, 52, 48, 42, 45, 58, 55],
+    [72, 68, 62, 55, 48, 52, 48, 42, 52, 48],
+    [95, 88, 82, 75, 68, 62, 55, 48, 72, 65]
+], dtype=np.int32)
+_SAMPLE_COSTS.flags.writeable = False
+
 
 class TransportationView(ctk.CTkFrame):
     """
@@ -32,6 +56,9 @@ class TransportationView(ctk.CTkFrame):
         self.num_sources = DEFAULT_MATRIX_SIZE
         self.num_destinations = DEFAULT_MATRIX_SIZE
         
+        # Labels of the input widgets, rebuilt only when the problem is resized
+        self._recompute_labels(self.num_sources, self.num_destinations)
+        
         self._create_layout()
         self._create_widgets()
     
@@ -150,6 +177,7 @@ class TransportationView(ctk.CTkFrame):
             text_color="gray"
         )
         self.balance_label.pack(side="right", padx=10)
+        self._balance_state = ("", "gray")
     
     def _create_supply_input(self):
         """Create supply input section"""
@@ -165,7 +193,7 @@ class TransportationView(ctk.CTkFrame):
         self.supply_input = VectorInput(
             supply_frame,
             size=self.num_sources,
-            labels=PLANTS[:self.num_sources],
+            labels=list(self._source_labels),
             orientation="horizontal",
             default_value="0",
             cell_width=80
@@ -187,8 +215,9 @@ class TransportationView(ctk.CTkFrame):
             matrix_frame,
             rows=self.num_sources,
             cols=self.num_destinations,
-            row_headers=PLANTS[:self.num_sources],
-            col_headers=[d[:10] for d in DESTINATIONS[:self.num_destinations]],
+            # Headers are copied because MatrixInput extends its header lists on resize
+            row_headers=list(self._source_labels),
+            col_headers=list(self._dest_headers),
             default_value="0",
             cell_width=70
         )
@@ -208,7 +237,7 @@ class TransportationView(ctk.CTkFrame):
         self.demand_input = VectorInput(
             demand_frame,
             size=self.num_destinations,
-            labels=[d[:12] for d in DESTINATIONS[:self.num_destinations]],
+            labels=list(self._dest_labels),
             orientation="horizontal",
             default_value="0",
             cell_width=80
@@ -269,28 +298,9 @@ class TransportationView(ctk.CTkFrame):
     
     def _load_sample(self):
         """Load sample PP Chemicals transportation problem"""
-        # Supply from 10 plants
-        supply = np.array([500, 400, 350, 450, 380, 420, 300, 360, 410, 330])
-        self.supply_input.set_values(supply)
-        
-        # Demand at 10 construction sites
-        demand = np.array([200, 180, 300, 250, 350, 280, 320, 400, 290, 330])
-        self.demand_input.set_values(demand)
-        
-        # Transportation cost matrix
-        cost_matrix = np.array([
-            [45, 72, 35, 58, 62, 48, 55, 80, 42, 65],
-            [38, 65, 42, 52, 58, 45, 50, 75, 38, 60],
-            [55, 48, 58, 42, 45, 52, 48, 62, 55, 45],
-            [62, 55, 48, 38, 42, 55, 52, 58, 48, 42],
-            [70, 58, 52, 45, 38, 48, 45, 52, 55, 48],
-            [58, 52, 55, 48, 45, 35, 42, 48, 52, 55],
-            [85, 78, 72, 65, 58, 52, 45, 38, 65, 58],
-            [78, 72, 65, 58, 52, 48, 42, 45, 58, 55],
-            [72, 68, 62, 55, 48, 52, 48, 42, 52, 48],
-            [95, 88, 82, 75, 68, 62, 55, 48, 72, 65]
-        ])
-        self.cost_matrix.set_matrix(cost_matrix)
+        self.supply_input.set_values(_SAMPLE_SUPPLY)
+        self.demand_input.set_values(_SAMPLE_DEMAND)
+        self.cost_matrix.set_matrix(_SAMPLE_COSTS)
         
         self._check_balance()
     
@@ -299,83 +309,68 @@ class TransportationView(ctk.CTkFrame):
         try:
             new_sources = int(self.sources_entry.get())
             new_dests = int(self.dest_entry.get())
-            
-            if new_sources < 1 or new_dests < 1:
-                return
-            
-            self.num_sources = new_sources
-            self.num_destinations = new_dests
-            
-            # Resize widgets
-            self.supply_input.destroy()
-            self.cost_matrix.destroy()
-            self.demand_input.destroy()
-            
-            # Recreate supply input
-            supply_parent = self.left_panel.winfo_children()[2]
-            self.supply_input = VectorInput(
-                supply_parent,
-                size=new_sources,
-                labels=[PLANTS[i] if i < len(PLANTS) else f"S{i+1}" for i in range(new_sources)],
-                orientation="horizontal",
-                default_value="0",
-                cell_width=80
-            )
-            self.supply_input.pack(fill="x", padx=10, pady=5)
-            
-            # Recreate cost matrix
-            matrix_parent = self.left_panel.winfo_children()[3]
-            self.cost_matrix = MatrixInput(
-                matrix_parent,
-                rows=new_sources,
-                cols=new_dests,
-                row_headers=[PLANTS[i] if i < len(PLANTS) else f"S{i+1}" for i in range(new_sources)],
-                col_headers=[DESTINATIONS[j][:10] if j < len(DESTINATIONS) else f"D{j+1}" for j in range(new_dests)],
-                default_value="0",
-                cell_width=70
-            )
-            self.cost_matrix.pack(fill="both", expand=True, padx=10, pady=5)
-            
-            # Recreate demand input
-            demand_parent = self.left_panel.winfo_children()[4]
-            self.demand_input = VectorInput(
-                demand_parent,
-                size=new_dests,
-                labels=[DESTINATIONS[j][:12] if j < len(DESTINATIONS) else f"D{j+1}" for j in range(new_dests)],
-                orientation="horizontal",
-                default_value="0",
-                cell_width=80
-            )
-            self.demand_input.pack(fill="x", padx=10, pady=5)
-            
         except ValueError:
-            pass
+            return
+        
+        if new_sources < 1 or new_dests < 1:
+            return
+        
+        sources_changed = new_sources != self.num_sources
+        dests_changed = new_dests != self.num_destinations
+        if not (sources_changed or dests_changed):
+            return
+        
+        self.num_sources = new_sources
+        self.num_destinations = new_dests
+        self._recompute_labels(new_sources, new_dests)
+        
+        # Resize the input widgets in place, keeping the values already entered;
+        # only the inputs along a changed dimension are touched
+        if sources_changed:
+            self.supply_input.resize(new_sources, list(self._source_labels))
+            self.cost_matrix.set_row_headers(list(self._source_labels))
+        if dests_changed:
+            self.cost_matrix.set_col_headers(list(self._dest_headers))
+            self.demand_input.resize(new_dests, list(self._dest_labels))
+        self.cost_matrix.resize(new_sources, new_dests)
+    
+    def _recompute_labels(self, num_sources: int, num_destinations: int):
+        """Rebuild the cached input labels for the given problem size"""
+        self._source_labels = tuple(PLANTS[i] if i < len(PLANTS) else f"S{i+1}" for i in range(num_sources))
+        destinations = [DESTINATIONS[j] if j < len(DESTINATIONS) else f"D{j+1}" for j in range(num_destinations)]
+        self._dest_headers = tuple(d[:10] for d in destinations)
+        self._dest_labels = tuple(d[:12] for d in destinations)
     
     def _check_balance(self):
         """Check if supply equals demand"""
-        supply = self.supply_input.get_values()
-        demand = self.demand_input.get_values()
-        
-        total_supply = np.sum(supply)
-        total_demand = np.sum(demand)
+        total_supply = self.supply_input.total()
+        total_demand = self.demand_input.total()
         
         if abs(total_supply - total_demand) < 1e-6:
-            self.balance_label.configure(
-                text=f"✓ Balanced (Supply = Demand = {total_supply:,.0f})",
-                text_color="#4CAF50"
-            )
+            text = f"✓ Balanced (Supply = Demand = {self._format_units(total_supply)})"
+            color = "#4CAF50"
         elif total_supply > total_demand:
-            diff = total_supply - total_demand
-            self.balance_label.configure(
-                text=f"⚠ Unbalanced: Excess supply of {diff:,.0f}",
-                text_color="#FF9800"
-            )
+            text = f"⚠ Unbalanced: Excess supply of {self._format_units(total_supply - total_demand)}"
+            color = "#FF9800"
         else:
-            diff = total_demand - total_supply
-            self.balance_label.configure(
-                text=f"⚠ Unbalanced: Excess demand of {diff:,.0f}",
-                text_color="#FF9800"
-            )
+            text = f"⚠ Unbalanced: Excess demand of {self._format_units(total_demand - total_supply)}"
+            color = "#FF9800"
+        
+        # Reconfiguring the label redraws it, so skip that when nothing changed
+        if (text, color) != self._balance_state:
+            self._set_balance_label(text, color)
+    
+    def _set_balance_label(self, text: str, color: str):
+        """Show a balance message and remember it"""
+        self.balance_label.configure(text=text, text_color=color)
+        self._balance_state = (text, color)
+    
+    @staticmethod
+    def _format_units(value: float) -> str:
+        """Format a unit count, using integer formatting for whole numbers"""
+        if value.is_integer():
+            return f"{int(value):,}"
+        return f"{value:,.0f}"
     
     def _solve(self):
         """Solve the transportation problem"""
@@ -451,4 +446,4 @@ class TransportationView(ctk.CTkFrame):
         self.cost_matrix.clear()
         self.result_display.clear()
         self.allocation_display.clear()
-        self.balance_label.configure(text="", text_color="gray")
+        self._set_balance_label("", "gray")
@@ -3,10 +3,23 @@ Output Formatting Utilities
 Functions for formatting numbers, currency, and solutions
 """
 
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 import numpy as np
 
 
+@lru_cache(maxsize=16)
+def _number_template(decimals: int) -> str:
+    """Format template for a number with thousands separator"""
+    return f"{{:,.{decimals}f}}"
+
+
+@lru_cache(maxsize=16)
+def _percentage_template(decimals: int) -> str:
+    """Format template for a percentage"""
+    return f"{{:.{decimals}f}}%"
+
+
 def format_number(value: float, decimals: int = 2) -> str:
     """
     Format a number with thousands separator
@@ -18,12 +31,7 @@ def format_number(value: float, decimals: int = 2) -> str:
     Returns:
         Formatted string
     """
-    if abs(value) >= 1e6:
-        return f"{value:,.{decimals}f}"
-    elif abs(value) >= 1000:
-        return f"{value:,.{decimals}f}"
-    else:
-        return f"{value:.{decimals}f}"
+    return _number_template(decimals).format(value)
 
 
 def format_currency(value: float, symbol: str = "Rs.", decimals: int = 2) -> str:
@@ -38,7 +46,7 @@ def format_currency(value: float, symbol: str = "Rs.", decimals: int = 2) -> str
     Returns:
         Formatted currency string
     """
-    return f"{symbol}{value:,.{decimals}f}"
+    return symbol + format_number(value, decimals)
 
 
 def format_percentage(value: float, decimals: int = 1) -> str:
@@ -54,7 +62,7 @@ def format_percentage(value: float, decimals: int = 1) -> str:
     """
     if value <= 1:
         value *= 100
-    return f"{value:.{decimals}f}%"
+    return _percentage_template(decimals).format(value)
 
 
 def format_solution(
@@ -73,13 +81,16 @@ def format_solution(
     Returns:
         Formatted solution string
     """
-    lines = []
+    solution = np.asarray(solution, dtype=np.float64)
     names = variable_names or [f"x{i+1}" for i in range(len(solution))]
+    num_names = len(names)
     
-    for i, val in enumerate(solution):
-        if abs(val) > threshold:
-            name = names[i] if i < len(names) else f"x{i+1}"
-            lines.append(f"{name}: {format_number(val, 4)}")
+    # Threshold in one vectorized pass; only the kept variables are formatted
+    kept = np.flatnonzero(np.abs(solution) > threshold)
+    lines = []
+    for i, val in zip(kept.tolist(), solution[kept].tolist()):
+        name = names[i] if i < num_names else f"x{i+1}"
+        lines.append(f"{name}: {val:,.4f}")
     
     return "\n".join(lines)
 
@@ -117,10 +128,10 @@ def format_matrix(
     lines.append(header)
     lines.append("-" * len(header))
     
-    # Rows
+    # Rows, with every cell formatted in a single vectorized call
+    cells = np.char.mod(f"%{col_width}.{decimals}f", matrix).tolist()
     for i, row_name in enumerate(row_names):
-        row_values = [f"{matrix[i,j]:>{col_width}.{decimals}f}" for j in range(cols)]
-        lines.append(f"{row_name:<{row_width}} | " + " | ".join(row_values))
+        lines.append(f"{row_name:<{row_width}} | " + " | ".join(cells[i]))
     
     return "\n".join(lines)
 
@@ -143,28 +154,42 @@ def format_sensitivity_report(report: Dict[str, Any]) -> str:
     
     # Shadow prices
     if 'shadow_prices' in report:
-        lines.append("\nSHADOW PRICES (Dual Values)")
-        lines.append("-" * 40)
-        for item in report['shadow_prices']:
-            lines.append(f"  {item['name']:.<30} {item['value']:>10.4f}")
+        items = report['shadow_prices']
+        _append_report_section(
+            lines, "SHADOW PRICES (Dual Values)",
+            [f"{item['name']:.<30}" for item in items], items
+        )
     
     # Reduced costs
     if 'reduced_costs' in report:
-        lines.append("\nREDUCED COSTS")
-        lines.append("-" * 40)
-        for item in report['reduced_costs']:
-            lines.append(f"  {item['name']:.<30} {item['value']:>10.4f}")
+        items = report['reduced_costs']
+        _append_report_section(
+            lines, "REDUCED COSTS",
+            [f"{item['name']:.<30}" for item in items], items
+        )
     
     # Slack values
     if 'slack_values' in report:
-        lines.append("\nSLACK/SURPLUS VALUES")
-        lines.append("-" * 40)
-        for item in report['slack_values']:
-            lines.append(f"  Constraint {item['constraint']:.<24} {item['value']:>10.4f}")
+        items = report['slack_values']
+        _append_report_section(
+            lines, "SLACK/SURPLUS VALUES",
+            [f"Constraint {item['constraint']:.<24}" for item in items], items
+        )
     
     return "\n".join(lines)
 
 
+def _append_report_section(lines: List[str], title: str, labels: List[str], items: List[Dict]):
+    """Append a titled section of padded labels and their values to a report"""
+    lines.append(f"\n{title}")
+    lines.append("-" * 40)
+    values = np.fromiter((item['value'] for item in items), dtype=np.float64, count=len(items))
+    lines.extend(
+        f"  {label} {value}"
+        for label, value in zip(labels, np.char.mod("%10.4f", values).tolist())
+    )
+
+
 def format_assignment_result(
     assignments: List[tuple],
     row_names: List[str],
@@ -188,14 +213,20 @@ def format_assignment_result(
     lines.append("OPTIMAL ASSIGNMENTS")
     lines.append("-" * 50)
     
-    for i, (r, c) in enumerate(assignments):
-        row_name = row_names[r] if r < len(row_names) else f"Worker {r+1}"
-        col_name = col_names[c] if c < len(col_names) else f"Task {c+1}"
-        cost = costs[i] if i < len(costs) else 0
-        
-        lines.append(f"  {row_name:.<20} → {col_name:.<15} ({cost:.0f})")
+    template = "  {row:.<20} → {col:.<15} ({cost:.0f})"
+    num_rows = len(row_names)
+    num_cols = len(col_names)
+    # Assignments without a cost entry are shown at 0
+    padded_costs = list(costs) + [0] * max(0, len(assignments) - len(costs))
     
-    total = sum(costs)
+    for (r, c), cost in zip(assignments, padded_costs):
+        lines.append(template.format(
+            row=row_names[r] if r < num_rows else f"Worker {r+1}",
+            col=col_names[c] if c < num_cols else f"Task {c+1}",
+            cost=cost
+        ))
+    
+    total = float(np.sum(costs))
     lines.append("-" * 50)
     lines.append(f"  {'TOTAL':.<35} {total:>10.0f}")
     
@@ -217,17 +248,22 @@ def format_transportation_result(routes: List[Dict]) -> str:
     lines.append("SHIPPING ROUTES")
     lines.append("-" * 60)
     
-    total_cost = 0
-    for route in routes:
+    # Find the shipped routes in one vectorized pass over the quantities
+    quantities = np.fromiter((route.get('quantity', 0) for route in routes), dtype=np.float64, count=len(routes))
+    shipped = np.flatnonzero(quantities > 0.001)
+    
+    route_costs = np.empty(len(shipped))
+    for k, i in enumerate(shipped.tolist()):
+        route = routes[i]
         qty = route.get('quantity', 0)
-        if qty > 0.001:
-            src = route.get('from', 'Source')
-            dest = route.get('to', 'Dest')
-            cost = route.get('unit_cost', 0)
-            route_cost = route.get('route_cost', qty * cost)
-            total_cost += route_cost
-            
-            lines.append(f"  {src:.<15} → {dest:.<15} : {qty:>6.0f} units @ {cost:.0f} = {route_cost:>10,.0f}")
+        src = route.get('from', 'Source')
+        dest = route.get('to', 'Dest')
+        cost = route.get('unit_cost', 0)
+        route_cost = route.get('route_cost', qty * cost)
+        route_costs[k] = route_cost
+        
+        lines.append(f"  {src:.<15} → {dest:.<15} : {qty:>6.0f} units @ {cost:.0f} = {route_cost:>10,.0f}")
+    total_cost = route_costs.sum()
     
     lines.append("-" * 60)
     lines.append(f"  {'TOTAL TRANSPORTATION COST':.<45} {total_cost:>10,.0f}")
@@ -69,7 +69,15 @@ def validate_matrix(matrix: np.ndarray) -> Tuple[bool, str]:
     if matrix.size == 0:
         return False, "Matrix is empty"
     
-    if not np.isfinite(matrix).all():
+    # Integer matrices cannot hold NaN or Inf
+    if matrix.dtype.kind in 'biu':
+        return True, "Valid"
+    
+    # NaN/Inf propagate into the sum; the element-wise check only runs when
+    # the sum is not finite, which may also be a plain overflow
+    with np.errstate(over='ignore', invalid='ignore'):
+        total = matrix.sum()
+    if not np.isfinite(total) and not np.isfinite(matrix).all():
         return False, "Matrix contains invalid values (NaN or Inf)"
     
     return True, "Valid"
@@ -145,6 +153,10 @@ def validate_transportation_inputs(
     Returns:
         Tuple of (is_valid, error_message)
     """
+    supply = np.asarray(supply, dtype=np.float64)
+    demand = np.asarray(demand, dtype=np.float64)
+    costs = np.asarray(costs, dtype=np.float64)
+    
     if len(supply) == 0:
         return False, "Supply values are empty"
     
@@ -157,13 +169,13 @@ def validate_transportation_inputs(
     if costs.shape != (len(supply), len(demand)):
         return False, f"Cost matrix shape {costs.shape} doesn't match supply ({len(supply)}) and demand ({len(demand)})"
     
-    if np.any(supply < 0):
+    if supply.min() < 0:
         return False, "Supply values must be non-negative"
     
-    if np.any(demand < 0):
+    if demand.min() < 0:
         return False, "Demand values must be non-negative"
     
-    if np.any(costs < 0):
+    if costs.min() < 0:
         return False, "Cost values must be non-negative"
     
     return True, "Valid"